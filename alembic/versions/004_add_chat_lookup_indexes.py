@@ -0,0 +1,43 @@
+"""add_chat_lookup_indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+Adds composite indexes for the chat hot paths:
+- ix_session_owner_lookup: active owner session lookup (clone_id, external_platform, status)
+  ordered by last_message_at DESC, matching the query's ORDER BY ... DESC LIMIT 1
+- ix_message_session_created: session history (session_id, clone_id) ordered by created_at
+
+Indexes are built CONCURRENTLY so the tables stay writable during the migration.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_session_owner_lookup',
+            'sessions',
+            ['clone_id', 'external_platform', 'status', sa.text('last_message_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_message_session_created',
+            'messages',
+            ['session_id', 'clone_id', 'created_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_message_session_created', table_name='messages', postgresql_concurrently=True)
+        op.drop_index('ix_session_owner_lookup', table_name='sessions', postgresql_concurrently=True)
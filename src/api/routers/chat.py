@@ -1,13 +1,14 @@
 """Chat API router"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from uuid import UUID
 
 from src.api.dependencies import get_clone_context, CloneContext, get_db
-from src.services.chat_service import ChatService
+from src.services.chat_service import ChatService, update_chunk_scores
 from src.database.models import Message
 from src.utils.logging import get_logger
 
@@ -211,7 +212,7 @@ async def send_message(
     """
     try:
         chat_service = ChatService(clone_id=clone_ctx.clone_id, tenant_id=clone_ctx.tenant_id, db=db)
-        user_msg, clone_msg = chat_service.send_message_and_get_response(
+        user_msg, clone_msg = await chat_service.asend_message_and_get_response(
             session_id=session_id,
             user_message=request.content,
             external_user_name=request.externalUserName,
@@ -235,14 +236,58 @@ async def send_message(
         )
 
 
+@router.post("/chat/session/{session_id}/message/stream")
+async def send_message_stream(
+    session_id: int,
+    request: SendMessageRequest,
+    clone_ctx: CloneContext = Depends(get_clone_context),
+    db: Session = Depends(get_db)
+):
+    """
+    Send a message and stream the clone response as plain text while it is generated.
+    The IDs the messages are stored under (once the stream completes) are returned in the
+    X-User-Message-Id and X-Clone-Message-Id headers.
+    """
+    try:
+        chat_service = ChatService(clone_id=clone_ctx.clone_id, tenant_id=clone_ctx.tenant_id, db=db)
+        user_msg_id, clone_msg_id, chunks = await chat_service.astream_message_response(
+            session_id=session_id,
+            user_message=request.content,
+            external_user_name=request.externalUserName,
+        )
+    except ValueError as e:
+        logger.warning("Invalid message send", error=str(e), session_id=session_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Error sending message", error=str(e), session_id=session_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to send message"
+        )
+
+    return StreamingResponse(
+        chunks,
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "X-User-Message-Id": str(user_msg_id),
+            "X-Clone-Message-Id": str(clone_msg_id),
+        },
+    )
+
+
 @router.post("/chat/message/{message_id}/feedback", status_code=status.HTTP_204_NO_CONTENT)
 async def submit_message_feedback(
     message_id: str,
     request: SubmitFeedbackRequest,
+    background_tasks: BackgroundTasks,
     clone_ctx: CloneContext = Depends(get_clone_context),
     db: Session = Depends(get_db)
 ):
-    """Submit feedback (thumbs up/down) for a clone message"""
+    """Submit feedback (thumbs up/down) for a clone message.
+    The rating is stored before responding; RL chunk scores are updated in the background."""
     try:
         message_uuid = UUID(message_id)
     except ValueError:
@@ -253,10 +298,18 @@ async def submit_message_feedback(
 
     try:
         chat_service = ChatService(clone_id=clone_ctx.clone_id, tenant_id=clone_ctx.tenant_id, db=db)
-        chat_service.submit_feedback(
+        message = chat_service.submit_feedback(
             message_id=message_uuid,
             rating=request.rating,
+            update_scores=False,
         )
+        if message.rag_context_json:
+            background_tasks.add_task(
+                update_chunk_scores,
+                clone_id=clone_ctx.clone_id,
+                rag_context=message.rag_context_json,
+                rating=request.rating,
+            )
 
         return None
     except ValueError as e:
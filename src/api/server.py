@@ -1,5 +1,7 @@
 """FastAPI application server"""
 
+import asyncio
+
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -56,9 +58,42 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Streamed chat replies report their stored message IDs in headers
+    expose_headers=["X-User-Message-Id", "X-Clone-Message-Id"],
 )
 
 
+def warm_caches() -> None:
+    """Load what the first chat requests would otherwise load: the Pinecone client and
+    index handle, the tokenizer, and the chunk score maps of recently busy clones.
+    Each step is best-effort; a failure only means that cache starts cold.
+    """
+    from src.database.db import get_db_session
+    from src.llm.client import _get_encoder
+    from src.rag.pinecone_store import PineconeStore
+    from src.services.chunk_score_service import ChunkScoreService
+
+    try:
+        PineconeStore()
+    except Exception as e:
+        logger.warning("Could not warm Pinecone index handle", error=str(e))
+
+    _get_encoder(settings.openai_model)
+
+    db = None
+    try:
+        db = get_db_session()
+        ChunkScoreService(db).warm_score_maps(
+            max_clones=settings.warm_cache_max_clones,
+            min_messages=settings.warm_cache_min_messages,
+        )
+    except Exception as e:
+        logger.warning("Could not warm chunk score maps", error=str(e))
+    finally:
+        if db is not None:
+            db.close()
+
+
 @app.on_event("startup")
 async def startup_event():
     """Log environment and configuration on application startup"""
@@ -105,6 +140,9 @@ async def startup_event():
             warning_count=len(warnings)
         )
 
+    if settings.warm_caches_on_startup:
+        await asyncio.to_thread(warm_caches)
+
 
 @app.get("/health")
 async def health_check():
@@ -30,12 +30,21 @@ class Settings(BaseSettings):
     # Database (optional - only needed for database operations)
     database_url: Optional[str] = Field(None, env="DATABASE_URL")
 
+    # Redis (optional - shares the LLM response and chunk score caches across workers)
+    redis_url: Optional[str] = Field(None, env="REDIS_URL")
+
     # Clerk Authentication (optional - only needed for API server)
     clerk_secret_key: Optional[str] = Field(None, env="CLERK_SECRET_KEY")
 
     # Pinecone Vector Database
     pinecone_api_key: str = Field(..., env="PINECONE_API_KEY")
     pinecone_index_name: str = Field("youtopia-dev", env="PINECONE_INDEX_NAME")
+    # Use the gRPC data plane (requires pinecone[grpc]; falls back to REST when not installed)
+    pinecone_use_grpc: bool = Field(False, env="PINECONE_USE_GRPC")
+    # Drop tenant_id/clone_id conditions from clone search filters after validating them.
+    # Saves Pinecone filter work, but leaves clone isolation to the namespace alone (no
+    # server-side ID check), so keep it off unless that overhead matters.
+    pinecone_strip_namespace_id_filters: bool = Field(False, env="PINECONE_STRIP_NAMESPACE_ID_FILTERS")
 
     # Vector Database (legacy - kept for backward compatibility)
     chroma_db_path: str = Field("./data/chroma_db", env="CHROMA_DB_PATH")
@@ -53,6 +62,12 @@ class Settings(BaseSettings):
     top_k_retrieval: int = Field(5, env="TOP_K_RETRIEVAL")
     chunk_size: int = Field(1000, env="CHUNK_SIZE")
     chunk_overlap: int = Field(200, env="CHUNK_OVERLAP")
+    # Optional SQLite file persisting embeddings across restarts (e.g. ./data/embeddings.sqlite)
+    embedding_cache_path: Optional[str] = Field(None, env="EMBEDDING_CACHE_PATH")
+    # Load the Pinecone index handle, tokenizer and busy clones' chunk scores at server startup
+    warm_caches_on_startup: bool = Field(False, env="WARM_CACHES_ON_STARTUP")
+    warm_cache_max_clones: int = Field(50, env="WARM_CACHE_MAX_CLONES")
+    warm_cache_min_messages: int = Field(10, env="WARM_CACHE_MIN_MESSAGES")
 
     # Semantic Chunking Settings
     chunking_strategy: str = Field("semantic", env="CHUNKING_STRATEGY")  # "recursive" or "semantic"
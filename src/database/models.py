@@ -87,6 +87,11 @@ class Session(Base):
     clone = relationship("Clone", back_populates="sessions")
     messages = relationship("Message", back_populates="session", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Owner session lookup: filter by clone/platform/status, newest last_message_at first
+        Index('ix_session_owner_lookup', 'clone_id', 'external_platform', 'status', text('last_message_at DESC')),
+    )
+
 
 class Document(Base):
     """Document model - stores document metadata"""
@@ -211,6 +216,11 @@ class Message(Base):
     clone = relationship("Clone", back_populates="messages")
     session = relationship("Session", back_populates="messages")
 
+    __table_args__ = (
+        # Session history: filter by session/clone, ordered by created_at
+        Index('ix_message_session_created', 'session_id', 'clone_id', 'created_at'),
+    )
+
 
 class DataSource(Base):
     """DataSource model - tracks specific data sources within integrations (e.g., Slack channels, Gmail labels)"""
@@ -114,6 +114,7 @@ class IngestionPipeline:
                 return 0
             
             chunks = self.slack_ingester.ingest_messages(messages, user_id=user_id)
+            self.slack_ingester.flush_raw_messages()
             
             # Inject tenant_id, clone_id, and ingestion timestamp into metadata
             ingestion_timestamp = datetime.utcnow().isoformat()
@@ -1,14 +1,26 @@
 """Slack message ingester"""
 
-from typing import List, Dict, Optional
-from datetime import datetime
+import asyncio
+import contextlib
+import gzip
+import ssl
+import time
+import uuid
+from typing import List, Dict, Optional, Tuple
 
 try:
-    from slack_sdk import WebClient
+    import aiohttp
+    import orjson
+    from slack_sdk.web.async_client import AsyncWebClient
+    from slack_sdk.http_retry.builtin_async_handlers import (
+        AsyncConnectionErrorRetryHandler,
+        AsyncRateLimitErrorRetryHandler,
+    )
     from slack_sdk.errors import SlackApiError
 except ImportError as exc:  # pragma: no cover - environment validation
     raise ImportError(
-        "slack_sdk is required for Slack ingestion. Install with `pip install slack-sdk`."
+        "slack_sdk, aiohttp and orjson are required for Slack ingestion. "
+        "Install with `pip install slack-sdk aiohttp orjson`."
     ) from exc
 
 from src.config.settings import settings
@@ -18,14 +30,36 @@ from src.ingestion.chunking import TextChunker
 
 logger = get_logger(__name__)
 
+# Maximum number of channel pagination loops running concurrently in fetch_user_messages_async
+MAX_CONCURRENT_CHANNEL_FETCHES = 8
+
+# Retries for Slack 429 "ratelimited" responses (honours Retry-After); concurrent
+# channel fetches hit the per-method rate limit, so these must not surface as errors
+SLACK_RATE_LIMIT_MAX_RETRIES = 5
+
+# search.messages page size (Slack maximum is 100)
+SLACK_SEARCH_PAGE_SIZE = 100
+
+# Errors meaning search.messages can't be used with this token, so channels are scanned instead
+SEARCH_UNAVAILABLE_ERRORS = {"not_authed", "missing_scope", "not_allowed_token_type", "no_permission"}
+
+# Size of the keep-alive connection pool shared by concurrent Slack API calls
+SLACK_CONNECTION_POOL_SIZE = 32
+
 
 class SlackIngester:
     """Ingester for Slack messages"""
     
     def __init__(self, bot_token: Optional[str] = None, s3_client: Optional[S3Client] = None):
         self.bot_token = bot_token or settings.slack_bot_token
-        self.client = WebClient(token=self.bot_token)
+        # Build the TLS context once and share it across every pooled session
+        self.ssl_context = ssl.create_default_context()
         self.s3_client = s3_client or S3Client()
+        # Cached UTC day bucket for raw S3 keys: (expires_at epoch, "YYYY-MM-DD")
+        self._day_bucket: Optional[Tuple[float, str]] = None
+        # Raw messages ingested since the last flush, for the current day bucket
+        self._raw_messages_day: Optional[str] = None
+        self._raw_messages_buffer: List[Dict] = []
         # TODO: Chunking improvements for Slack messages (when actively used):
         # 1. Consider semantic chunking for long messages
         # 2. Keep conversation threads together as context
@@ -35,6 +69,29 @@ class SlackIngester:
         # See: src/ingestion/context_enricher.py for contextual enrichment pattern.
         self.chunker = TextChunker()
     
+    def _build_async_client(self, session: Optional[aiohttp.ClientSession] = None) -> AsyncWebClient:
+        """Create an AsyncWebClient that retries connection errors and rate-limited calls"""
+        return AsyncWebClient(
+            token=self.bot_token,
+            ssl=self.ssl_context,
+            session=session,
+            retry_handlers=[
+                AsyncConnectionErrorRetryHandler(),
+                AsyncRateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_MAX_RETRIES),
+            ],
+        )
+    
+    @contextlib.asynccontextmanager
+    async def _pooled_client(self):
+        """
+        Yield an AsyncWebClient backed by one keep-alive connection pool, so every
+        call made through it (including each pagination page) reuses open sockets
+        instead of paying a TCP+TLS handshake per request.
+        """
+        connector = aiohttp.TCPConnector(limit=SLACK_CONNECTION_POOL_SIZE, ssl=self.ssl_context)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            yield self._build_async_client(session=session)
+    
     def fetch_channel_messages(
         self,
         channel_id: str,
@@ -43,12 +100,37 @@ class SlackIngester:
         latest: Optional[float] = None,
     ) -> List[Dict]:
         """Fetch messages from a Slack channel"""
+        return asyncio.run(
+            self.fetch_channel_messages_async(channel_id, limit=limit, oldest=oldest, latest=latest)
+        )
+    
+    async def fetch_channel_messages_async(
+        self,
+        channel_id: str,
+        limit: int = 1000,
+        oldest: Optional[float] = None,
+        latest: Optional[float] = None,
+        client: Optional[AsyncWebClient] = None,
+    ) -> List[Dict]:
+        """Fetch messages from a Slack channel (uses a new pooled client if none is given)"""
+        if client is None:
+            async with self._pooled_client() as pooled_client:
+                return await self.fetch_channel_messages_async(
+                    channel_id,
+                    limit=limit,
+                    oldest=oldest,
+                    latest=latest,
+                    client=pooled_client,
+                )
+        
         messages = []
         cursor = None
         
         try:
+            # Pages within a channel are serial (each depends on next_cursor),
+            # but several channels can paginate concurrently on one event loop
             while True:
-                response = self.client.conversations_history(
+                response = await client.conversations_history(
                     channel=channel_id,
                     limit=min(limit, 200),  # Slack API limit
                     cursor=cursor,
@@ -84,27 +166,155 @@ class SlackIngester:
         latest: Optional[float] = None,
     ) -> List[Dict]:
         """Fetch messages from a specific user across all channels"""
-        # Note: This requires searching across channels
-        # For now, we'll fetch from channels the bot has access to
+        return asyncio.run(
+            self.fetch_user_messages_async(user_id, limit=limit, oldest=oldest, latest=latest)
+        )
+    
+    async def fetch_user_messages_async(
+        self,
+        user_id: str,
+        limit: int = 1000,
+        oldest: Optional[float] = None,
+        latest: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        Fetch messages from a specific user across all channels.
+        
+        Uses server-side search (search.messages) so only the user's messages are
+        transferred. Falls back to scanning every channel's history concurrently and
+        filtering client-side when the token can't use search (bot tokens, missing
+        search:read scope).
+        """
+        # Share one keep-alive connection pool across every call in this run
+        async with self._pooled_client() as client:
+            try:
+                return await self.fetch_user_messages_via_search_async(
+                    user_id,
+                    limit=limit,
+                    oldest=oldest,
+                    latest=latest,
+                    client=client,
+                )
+            except SlackApiError as e:
+                error = e.response.get("error") if e.response else None
+                if error not in SEARCH_UNAVAILABLE_ERRORS:
+                    logger.error("Slack API error", error=str(e))
+                    raise
+                logger.info("Slack search unavailable, scanning channels instead", error=error)
+            
+            return await self._fetch_user_messages_by_channel_scan(
+                user_id,
+                client,
+                limit=limit,
+                oldest=oldest,
+                latest=latest,
+            )
+    
+    async def fetch_user_messages_via_search_async(
+        self,
+        user_id: str,
+        limit: int = 1000,
+        oldest: Optional[float] = None,
+        latest: Optional[float] = None,
+        client: Optional[AsyncWebClient] = None,
+    ) -> List[Dict]:
+        """Fetch a user's messages with search.messages (requires a user token with search:read)"""
+        if client is None:
+            async with self._pooled_client() as pooled_client:
+                return await self.fetch_user_messages_via_search_async(
+                    user_id,
+                    limit=limit,
+                    oldest=oldest,
+                    latest=latest,
+                    client=pooled_client,
+                )
+        
+        # Search date modifiers are day-granular; exact bounds are applied on ts below
+        query = f"from:<@{user_id}>"
+        if oldest is not None:
+            query += f" after:{time.strftime('%Y-%m-%d', time.gmtime(oldest - 86400))}"
+        if latest is not None:
+            query += f" before:{time.strftime('%Y-%m-%d', time.gmtime(latest + 86400))}"
+        
+        messages = []
+        page = 1
+        while True:
+            response = await client.search_messages(
+                query=query,
+                count=SLACK_SEARCH_PAGE_SIZE,
+                page=page,
+                sort="timestamp",
+            )
+            results = response["messages"]
+            for match in results.get("matches", []):
+                ts = float(match.get("ts", 0))
+                if (oldest is not None and ts < oldest) or (latest is not None and ts > latest):
+                    continue
+                # Search matches carry the channel as an object; normalize to the
+                # conversations_history shape (channel id string)
+                channel = match.get("channel")
+                if isinstance(channel, dict):
+                    match = {**match, "channel": channel.get("id")}
+                messages.append(match)
+            
+            if len(messages) >= limit or page >= results.get("paging", {}).get("pages", 0):
+                break
+            page += 1
+        
+        messages = messages[:limit]
+        logger.info("Fetched user messages via search", user_id=user_id, count=len(messages))
+        return messages
+    
+    async def _fetch_user_messages_by_channel_scan(
+        self,
+        user_id: str,
+        client: AsyncWebClient,
+        limit: int = 1000,
+        oldest: Optional[float] = None,
+        latest: Optional[float] = None,
+    ) -> List[Dict]:
+        """Fetch every accessible channel's history concurrently and keep the user's messages"""
         messages = []
         
         try:
             # Get list of channels
-            channels_response = self.client.conversations_list(types="public_channel,private_channel")
+            channels_response = await client.conversations_list(
+                types="public_channel,private_channel"
+            )
             
             if not channels_response["ok"]:
                 logger.error("Error fetching channels", error=channels_response.get("error"))
                 return messages
             
-            # Search messages in each channel
-            for channel in channels_response["channels"]:
-                channel_messages = self.fetch_channel_messages(
-                    channel["id"],
-                    limit=limit,
-                    oldest=oldest,
-                    latest=latest,
-                )
-                
+            channels = channels_response["channels"]
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNEL_FETCHES)
+            
+            async def fetch_channel(channel_id: str) -> List[Dict]:
+                async with semaphore:
+                    return await self.fetch_channel_messages_async(
+                        channel_id,
+                        limit=limit,
+                        oldest=oldest,
+                        latest=latest,
+                        client=client,
+                    )
+            
+            # Search messages in each channel concurrently
+            results = await asyncio.gather(
+                *[fetch_channel(channel["id"]) for channel in channels],
+                return_exceptions=True,
+            )
+            
+            for channel, channel_messages in zip(channels, results):
+                if isinstance(channel_messages, BaseException):
+                    # One inaccessible channel shouldn't abort the whole fetch
+                    logger.warning(
+                        "Skipping channel after fetch error",
+                        channel=channel["id"],
+                        error=str(channel_messages),
+                    )
+                    continue
+            
                 # Filter by user
                 user_messages = [
                     msg for msg in channel_messages
@@ -117,7 +327,7 @@ class SlackIngester:
         except SlackApiError as e:
             logger.error("Slack API error", error=str(e))
             raise
-    
+
     def format_message(self, message: Dict) -> str:
         """Format a Slack message for ingestion"""
         text = message.get("text", "")
@@ -135,47 +345,121 @@ class SlackIngester:
         source_name: str = "slack",
         user_id: Optional[str] = None,
     ) -> List[Dict]:
-        """Ingest Slack messages and return chunks"""
+        """
+        Ingest Slack messages and return chunks.
+        
+        Raw messages are buffered rather than uploaded immediately; call
+        flush_raw_messages() once ingestion is done to save them to S3.
+        """
         if not messages:
             return []
         
         logger.info("Ingesting Slack messages", message_count=len(messages))
         
-        # Format messages
-        formatted_texts = []
+        # Group messages by conversation so consecutive short messages from the
+        # same user/channel/thread can be packed into one chunk
+        groups: Dict[Tuple, List[Tuple[Dict, str]]] = {}
+        # Messages are plain text (see format_message), so read it inline and skip
+        # empty messages before doing any per-message work
         for msg in messages:
-            formatted_text = self.format_message(msg)
-            if formatted_text.strip():
-                formatted_texts.append(formatted_text)
+            if text := (msg.get("text") or "").strip():
+                group_key = (msg.get("channel"), msg.get("user") or user_id, msg.get("thread_ts"))
+                groups.setdefault(group_key, []).append((msg, text))
         
-        # Combine into chunks (each message or group of messages)
         chunks = []
-        for i, text in enumerate(formatted_texts):
-            metadata = {
-                "source": source_name,
-                "message_id": messages[i].get("ts"),
-                "user_id": messages[i].get("user") or user_id,
-                "channel_id": messages[i].get("channel"),
-                "timestamp": messages[i].get("ts"),
-            }
-            
-            # Chunk if message is long
-            if len(text) > settings.chunk_size:
-                message_chunks = self.chunker.chunk_text(text, metadata)
-                chunks.extend(message_chunks)
-            else:
-                chunks.append({
-                    "text": text,
-                    "metadata": metadata,
-                })
-        
-        # Save raw messages to S3
-        import json
-        raw_data = json.dumps(messages, indent=2).encode("utf-8")
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-        s3_key = f"raw/slack/{timestamp}/messages.json"
-        self.s3_client.put_object(s3_key, raw_data, content_type="application/json")
+        for (channel_id, msg_user_id, thread_ts), group in groups.items():
+            for buffer_messages in self._pack_messages(group):
+                text = "\n".join(formatted_text for _, formatted_text in buffer_messages)
+                first_msg = buffer_messages[0][0]
+                metadata = {
+                    "source": source_name,
+                    "message_id": first_msg.get("ts"),
+                    "message_ids": [msg.get("ts") for msg, _ in buffer_messages if msg.get("ts")],
+                    "user_id": msg_user_id,
+                    "channel_id": channel_id,
+                    "timestamp": first_msg.get("ts"),
+                }
+                if thread_ts:
+                    metadata["thread_ts"] = thread_ts
+                # Pinecone rejects null metadata values
+                metadata = {k: v for k, v in metadata.items() if v is not None}
+                
+                # Only a single message longer than chunk_size still needs splitting
+                if len(text) > settings.chunk_size:
+                    chunks.extend(self.chunker.chunk_text(text, metadata))
+                else:
+                    chunks.append({
+                        "text": text,
+                        "metadata": metadata,
+                    })
+        
+        # Buffer raw messages; they are written to S3 by flush_raw_messages()
+        self._buffer_raw_messages(messages)
         
         logger.info("Slack messages ingested", chunk_count=len(chunks))
         return chunks
-
+    
+    def _pack_messages(self, group: List[Tuple[Dict, str]]) -> List[List[Tuple[Dict, str]]]:
+        """Greedily pack (message, text) pairs into buffers of at most chunk_size characters"""
+        buffers = []
+        current = []
+        current_length = 0
+        for item in group:
+            text_length = len(item[1])
+            # +1 for the newline separator between packed messages
+            if current and current_length + 1 + text_length > settings.chunk_size:
+                buffers.append(current)
+                current = []
+                current_length = 0
+            current_length += text_length + (1 if current else 0)
+            current.append(item)
+        if current:
+            buffers.append(current)
+        return buffers
+    
+    def _current_day(self) -> str:
+        """Return the current UTC day string, recomputed only when the day rolls over"""
+        now = time.time()
+        if self._day_bucket is None or now >= self._day_bucket[0]:
+            day_start = now - (now % 86400)
+            self._day_bucket = (day_start + 86400, time.strftime("%Y-%m-%d", time.gmtime(now)))
+        return self._day_bucket[1]
+    
+    def _buffer_raw_messages(self, messages: List[Dict]) -> None:
+        """Add raw messages to the current day's buffer, flushing the previous day on rollover"""
+        day = self._current_day()
+        if self._raw_messages_day != day:
+            # Anything left over (e.g. a failed upload) is kept and saved with the new day
+            if self._raw_messages_buffer:
+                self.flush_raw_messages()
+            self._raw_messages_day = day
+        self._raw_messages_buffer.extend(messages)
+    
+    def flush_raw_messages(self) -> bool:
+        """
+        Save the raw messages buffered since the last flush to S3.
+        
+        Each flush writes its own object under the day prefix
+        (raw/slack/{day}/messages-{epoch_ms}-{suffix}.json.gz), so batches from
+        different calls or processes never overwrite each other. The buffer is
+        cleared once the upload succeeds.
+        """
+        if not self._raw_messages_buffer:
+            return True
+        
+        # Compact JSON straight to bytes; Slack JSON compresses ~5-8x, and level 1 is
+        # nearly as small as the default level at a fraction of the CPU
+        raw_data = gzip.compress(orjson.dumps(self._raw_messages_buffer), compresslevel=1)
+        s3_key = (
+            f"raw/slack/{self._raw_messages_day}/"
+            f"messages-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.json.gz"
+        )
+        uploaded = self.s3_client.put_object(
+            s3_key,
+            raw_data,
+            content_type="application/json",
+            content_encoding="gzip",
+        )
+        if uploaded:
+            self._raw_messages_buffer = []
+        return uploaded
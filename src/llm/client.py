@@ -1,8 +1,18 @@
 """OpenAI client wrapper with retry logic"""
 
+import asyncio
+import functools
+import random
 import time
-from typing import Optional, Iterator, AsyncIterator
-from openai import OpenAI, AsyncOpenAI
+from typing import Dict, List, Optional, Iterator, AsyncIterator
+import tiktoken
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    APIConnectionError,
+    InternalServerError,
+    RateLimitError,
+)
 from openai.types.chat import ChatCompletion
 
 from src.config.settings import settings
@@ -10,10 +20,64 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# OpenAI chat format overhead: every message is wrapped in role/separator tokens,
+# and every reply is primed with the assistant role.
+TOKENS_PER_MESSAGE = 4
+TOKENS_REPLY_PRIMING = 2
+
+# Threads tiktoken uses for batch encoding
+TOKENIZER_THREADS = 4
+
+# Transient errors worth retrying; anything else (auth, bad request, ...) fails immediately
+RETRYABLE_ERRORS = (APIConnectionError, InternalServerError, RateLimitError)
+
+# Upper bound on a single backoff wait, in seconds
+MAX_RETRY_DELAY = 30.0
+
+
+@functools.lru_cache(maxsize=8)
+def _load_encoder(model: str) -> tiktoken.Encoding:
+    """Load (once per model) the tiktoken BPE encoder for a model.
+
+    Raises if the encoding can't be loaded; failures are not cached, so a
+    transient download error is retried on the next call.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown/new model name - cl100k_base covers the GPT-3.5/GPT-4 family
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _get_encoder(model: str) -> Optional[tiktoken.Encoding]:
+    """Return the encoder for a model, or None if it can't be loaded (e.g. the BPE
+    file can't be fetched), in which case callers fall back to the character heuristic.
+    """
+    try:
+        return _load_encoder(model)
+    except Exception as e:
+        logger.warning("Could not load tiktoken encoder, using approximate token counts", model=model, error=str(e))
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> OpenAI:
+    """Shared OpenAI client per API key, so every LLMClient reuses one keep-alive pool"""
+    return OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Shared AsyncOpenAI client per API key, so every async caller reuses one connection pool"""
+    return AsyncOpenAI(api_key=api_key)
+
 
 class LLMClient:
     """OpenAI client wrapper with retry logic and error handling"""
     
+    # Overrides the shared async client when set (e.g. in tests)
+    _async_client: Optional[AsyncOpenAI] = None
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -25,7 +89,7 @@ class LLMClient:
         self.model = model or settings.openai_model
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = _get_client(self.api_key)
     
     def generate(
         self,
@@ -45,7 +109,7 @@ class LLMClient:
                     stream=stream,
                 )
                 return response
-            except Exception as e:
+            except RETRYABLE_ERRORS as e:
                 logger.warning(
                     "OpenAI API call failed",
                     attempt=attempt + 1,
@@ -54,7 +118,7 @@ class LLMClient:
                 )
                 
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(self._backoff_delay(attempt, e))
                 else:
                     logger.error("OpenAI API call failed after all retries", error=str(e))
                     raise
@@ -79,10 +143,100 @@ class LLMClient:
             logger.error("Error generating stream", error=str(e))
             raise
     
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before the next attempt.
+        
+        Honors the server's Retry-After header on rate limits, otherwise uses
+        full-jitter exponential backoff so concurrent callers don't retry in lockstep.
+        """
+        if isinstance(error, RateLimitError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                return min(float(retry_after), MAX_RETRY_DELAY)
+            except (TypeError, ValueError):
+                pass
+        return random.uniform(0, min(MAX_RETRY_DELAY, self.retry_delay * 2 ** attempt))
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The AsyncOpenAI client shared by every LLMClient with this API key"""
+        return self._async_client or get_async_openai_client(self.api_key)
+    
+    async def generate_async(
+        self,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> ChatCompletion:
+        """Generate completion with retry logic without blocking the event loop"""
+        for attempt in range(self.max_retries):
+            try:
+                return await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            except RETRYABLE_ERRORS as e:
+                logger.warning(
+                    "OpenAI API call failed",
+                    attempt=attempt + 1,
+                    max_retries=self.max_retries,
+                    error=str(e),
+                )
+                
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt, e))
+                else:
+                    logger.error("OpenAI API call failed after all retries", error=str(e))
+                    raise
+    
+    async def generate_stream_async(
+        self,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Generate streaming completion, yielding content deltas as they arrive"""
+        try:
+            stream = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+        except Exception as e:
+            logger.error("Error generating stream", error=str(e))
+            raise
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     def count_tokens(self, text: str) -> int:
-        """Estimate token count (rough approximation)"""
-        # Simple approximation: ~4 characters per token
-        return len(text) // 4
+        """Count tokens in text using the model's BPE encoding"""
+        encoder = _get_encoder(self.model)
+        if encoder is None:
+            # Simple approximation: ~4 characters per token
+            return len(text) // 4
+        return len(encoder.encode(text, disallowed_special=()))
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for several texts in one call (tiktoken encodes them in parallel)"""
+        encoder = _get_encoder(self.model)
+        if encoder is None:
+            return [len(text) // 4 for text in texts]
+        return [
+            len(tokens) for tokens in encoder.encode_batch(
+                texts, num_threads=TOKENIZER_THREADS, disallowed_special=()
+            )
+        ]
+    
+    def count_messages_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """Count prompt tokens for a chat messages array, including per-message overhead"""
+        content_tokens = sum(self.count_tokens_batch([msg["content"] for msg in messages]))
+        return content_tokens + TOKENS_PER_MESSAGE * len(messages) + TOKENS_REPLY_PRIMING
     
     def get_usage_stats(self, response: ChatCompletion) -> dict:
         """Extract usage statistics from response"""
@@ -95,3 +249,7 @@ class LLMClient:
         return {}
 
 
+@functools.lru_cache(maxsize=1)
+def get_llm_client() -> LLMClient:
+    """Process-wide default LLMClient, so its lazily created async client is shared as well"""
+    return LLMClient()
@@ -3,9 +3,15 @@
 
 from typing import List, Dict, Optional
 from uuid import UUID
-from src.llm.client import LLMClient
+from src.llm.client import LLMClient, get_llm_client
 from src.llm.prompt_service import PromptService
-from src.rag.retriever import RAGRetriever
+from src.llm.response_cache import (
+    MAX_CACHEABLE_TEMPERATURE,
+    ResponseCache,
+    get_response_cache,
+    make_cache_key,
+)
+from src.rag.retriever import RAGRetriever, CONTEXT_SEPARATOR
 from src.rag.clone_vector_store import CloneVectorStore
 from src.personality.profile import PersonalityProfile
 from src.config.settings import settings
@@ -21,9 +27,11 @@ class PromptBuilder:
         self,
         llm_client: Optional[LLMClient] = None,
         rag_retriever: Optional[RAGRetriever] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_llm_client()
         self.rag_retriever = rag_retriever or RAGRetriever()
+        self.response_cache = response_cache or get_response_cache()
         self.prompt_service = PromptService(llm_client=self.llm_client)
     
     def build_system_prompt(self, profile: Optional[PersonalityProfile] = None) -> str:
@@ -33,16 +41,11 @@ class PromptBuilder:
         DEPRECATED: This method is kept for backward compatibility.
         The actual prompt building logic is now in PromptService.
         """
-        # Use PromptService to build system prompt
+        # Use the shared PromptService system prompt (template segments cached per clone name)
         # Note: PromptService uses clone_name, but this method only has profile
         # For backward compatibility, we'll use a default clone name
         clone_name = profile.person_name if profile and profile.person_name else "professional"
-        return self.prompt_service.build_messages(
-            current_message="",  # Empty since we only want the system prompt
-            rag_context="",
-            conversation_history=None,
-            clone_name=clone_name,
-        )[0]["content"]
+        return self.prompt_service.build_system_prompt(clone_name)
     
     def build_messages(
         self,
@@ -59,15 +62,6 @@ class PromptBuilder:
         This method now uses PromptService for the actual prompt building.
         It still handles RAG retrieval internally for backward compatibility.
         """
-        # Retrieve relevant context (automatically filtered by clone_id/tenant_id if CloneVectorStore is used)
-        context = ""
-        if include_context:
-            # CloneVectorStore automatically filters by clone_id/tenant_id
-            context = self.rag_retriever.retrieve_and_format(
-                user_query,
-                top_k=settings.top_k_retrieval,
-            )
-        
         # Determine clone name from profile or use default
         clone_name = "professional"
         if profile and profile.person_name:
@@ -76,36 +70,48 @@ class PromptBuilder:
         # Use PromptService to build messages (uses ChatService logic - context in system message)
         messages = self.prompt_service.build_messages(
             current_message=user_query,
-            rag_context=context,
+            rag_context="",
             conversation_history=None,  # PromptBuilder doesn't support conversation history
             clone_name=clone_name,
         )
         
-        # Check token limits (maintain backward compatibility)
+        if not include_context:
+            return messages
+        
+        # Retrieve raw chunks (automatically filtered by clone_id/tenant_id if CloneVectorStore is used)
+        results = self.rag_retriever.retrieve(user_query, top_k=settings.top_k_retrieval)
+        if not results:
+            return messages
+        
+        # Pack chunks in rank order into whatever the prompt leaves of the token budget,
+        # so the context always fits without truncating mid-chunk
         max_tokens = max_context_tokens or settings.max_context_tokens
-        total_estimated_tokens = sum(self.llm_client.count_tokens(msg["content"]) for msg in messages)
+        budget = max_tokens - self.llm_client.count_messages_tokens(messages)
+        formatted = [self.rag_retriever.format_chunk(result) for result in results]
+        separator_tokens, *chunk_tokens = self.llm_client.count_tokens_batch([CONTEXT_SEPARATOR, *formatted])
         
-        if total_estimated_tokens > max_tokens:
+        context_parts = []
+        for result, part, token_count in zip(results, formatted, chunk_tokens):
+            result["token_count"] = token_count
+            cost = token_count + (separator_tokens if context_parts else 0)
+            if cost > budget:
+                break
+            context_parts.append(part)
+            budget -= cost
+        
+        if len(context_parts) < len(results):
             logger.warning(
-                "Message tokens exceed limit",
-                estimated_tokens=total_estimated_tokens,
+                "Context chunks dropped to fit token limit",
+                chunks_retrieved=len(results),
+                chunks_used=len(context_parts),
                 max_tokens=max_tokens,
             )
-            # Truncate context if needed
-            if context:
-                context_tokens = self.llm_client.count_tokens(context)
-                if context_tokens > max_tokens // 2:
-                    # Truncate context
-                    truncated_length = (max_tokens // 2) * 4  # Rough char estimate
-                    truncated_context = context[:truncated_length].rsplit(" ", 1)[0] + "..."
-                    
-                    # Rebuild messages with truncated context
-                    messages = self.prompt_service.build_messages(
-                        current_message=user_query,
-                        rag_context=truncated_context,
-                        conversation_history=None,
-                        clone_name=clone_name,
-                    )
+        
+        if context_parts:
+            # Only the system message carries the context
+            messages[0]["content"] = self.prompt_service.build_system_prompt(
+                clone_name, CONTEXT_SEPARATOR.join(context_parts)
+            )
         
         return messages
     
@@ -132,10 +138,30 @@ class PromptBuilder:
         if stream:
             stream = self.llm_client.generate_stream(messages, temperature=temperature)
             return stream
-        else:
-            response = self.llm_client.generate(messages, temperature=temperature)
-            usage_stats = self.llm_client.get_usage_stats(response)
-            logger.info("Response generated", usage=usage_stats)
-            return response.choices[0].message.content
+        
+        # Only (near-)deterministic responses are worth reusing
+        cache_key = None
+        if temperature <= MAX_CACHEABLE_TEMPERATURE:
+            # Messages carry the retrieved context, so a changed context is a new key
+            cache_key = make_cache_key(
+                clone_id,
+                tenant_id,
+                self.llm_client.model,
+                temperature,
+                *(f"{m['role']}:{m['content']}" for m in messages),
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Response served from cache", query_preview=user_query[:50])
+                return cached
+        
+        response = self.llm_client.generate(messages, temperature=temperature)
+        usage_stats = self.llm_client.get_usage_stats(response)
+        logger.info("Response generated", usage=usage_stats)
+        content = response.choices[0].message.content
+        
+        if cache_key is not None and content is not None:
+            self.response_cache.set(cache_key, content)
+        return content
 
 
@@ -4,20 +4,95 @@ This service centralizes all prompt building logic, using the approach from Chat
 where RAG context is placed in the system message.
 """
 
-from typing import List, Dict, Optional
-from src.llm.client import LLMClient
+import functools
+import string
+from typing import List, Dict, Optional, Tuple
+from src.llm.client import LLMClient, get_llm_client
 from src.config.settings import settings
 from src.personality.profile import PersonalityProfile
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+NO_RAG_CONTEXT_TEXT = "No specific context available for this query."
+DEFAULT_STYLE_INSTRUCTIONS = "similar to the knowledge provided ealier."
+
+# Number of most recent conversation messages included in the prompt
+MAX_HISTORY_MESSAGES = 10
+
+# System prompt template, parsed once at import time
+SYSTEM_PROMPT_TEMPLATE = string.Template("""You are ${clone_name}'s AI clone, that thinks like them and acts like them. 
+        You can help ${clone_name}'s customers with their professional questions, answering based on your knowledge.
+
+Your knowledge comes from the following sources:
+
+${rag_context}
+
+Your communication style is:
+
+${style_instructions}
+
+Instructions:
+- Answer as ${clone_name}, speaking in first person
+- If the user asks a question using the words "you","your", "yours", "you're", "you've", "you'll", "you'd", "you're", "you've", "you'll", "you'd", etc, answer as if you are ${clone_name}.
+- Avoid extenssively using symbols that remind the user you are AI (e.g. em dashes, astrics, etc) unless they are absolutely necessary.
+- Replicate ${clone_name}'s communication style when possible and relevant
+- Use the provided context to answer questions accurately
+- If the context doesn't contain relevant information, say so honestly!
+- Be helpful, concise, and professional
+- Maintain conversation continuity by referencing earlier messages when relevant 
+- Ask clarifying questions or follow-up questions when relevant (not EVERY message) to keep the conversation engaging and natural. 
+Those questions should be relevant to the conversation and the user's query, and help you to learn more about the user's business and needs, to help them most effectively.
+""")
+
+# Placeholder substituted for rag_context when pre-rendering the per-clone template segments
+_RAG_CONTEXT_MARKER = "\x00rag_context\x00"
+
+
+@functools.lru_cache(maxsize=256)
+def _system_prompt_segments(clone_name: Optional[str], style_instructions: str) -> Tuple[str, str]:
+    """Render everything except rag_context, split into (head, tail) around it.
+
+    clone_name and style_instructions are stable for a clone, while rag_context
+    changes every turn, so each turn only needs a three-way concatenation.
+    """
+    rendered = SYSTEM_PROMPT_TEMPLATE.substitute(
+        clone_name=clone_name,
+        rag_context=_RAG_CONTEXT_MARKER,
+        style_instructions=style_instructions,
+    )
+    head, tail = rendered.split(_RAG_CONTEXT_MARKER, 1)
+    return head, tail
+
+
+def render_system_prompt(
+    clone_name: Optional[str],
+    rag_context: str = "",
+    style_instructions: str = "",
+) -> str:
+    """Render the clone system prompt with RAG context and style instructions"""
+    head, tail = _system_prompt_segments(clone_name, style_instructions or DEFAULT_STYLE_INSTRUCTIONS)
+    return head + (rag_context or NO_RAG_CONTEXT_TEXT) + tail
+
 
 class PromptService:
     """Centralized service for building LLM prompts with RAG context, personality, and conversation history"""
     
     def __init__(self, llm_client: Optional[LLMClient] = None):
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_llm_client()
+    
+    def build_system_prompt(
+        self,
+        clone_name: Optional[str] = None,
+        rag_context: str = "",
+        style_instructions: str = "",
+    ) -> str:
+        """Build the system message content for a clone (template segments are cached per clone)"""
+        return render_system_prompt(
+            clone_name=clone_name,
+            rag_context=rag_context,
+            style_instructions=style_instructions,
+        )
     
     def build_messages(
         self,
@@ -39,54 +114,29 @@ class PromptService:
         Args:
             current_message: The current user message/query
             rag_context: Retrieved RAG context (formatted string)
-            conversation_history: List of Message objects from database (optional)
+            conversation_history: Messages with .role and .content, oldest first: Message objects
+                or (role, content) rows from database (optional)
             clone_name: Name of the clone (e.g., "John Doe" or "the AI Clone")
         
         Returns:
             List of message dicts in OpenAI format: [{"role": "system", "content": "..."}, ...]
         """
-        messages = []
-
         # System message with RAG context (copied from ChatService._build_llm_messages)
         # TODO: consider adding personality profile and style to the system prompt.
-        system_prompt = f"""You are {clone_name}'s AI clone, that thinks like them and acts like them. 
-        You can help {clone_name}'s customers with their professional questions, answering based on your knowledge.
-
-Your knowledge comes from the following sources:
-
-{rag_context if rag_context else "No specific context available for this query."}
-
-Your communication style is:
-
-{style_instructions if style_instructions else "similar to the knowledge provided ealier."}
-
-Instructions:
-- Answer as {clone_name}, speaking in first person
-- If the user asks a question using the words "you","your", "yours", "you're", "you've", "you'll", "you'd", "you're", "you've", "you'll", "you'd", etc, answer as if you are {clone_name}.
-- Avoid extenssively using symbols that remind the user you are AI (e.g. em dashes, astrics, etc) unless they are absolutely necessary.
-- Replicate {clone_name}'s communication style when possible and relevant
-- Use the provided context to answer questions accurately
-- If the context doesn't contain relevant information, say so honestly!
-- Be helpful, concise, and professional
-- Maintain conversation continuity by referencing earlier messages when relevant 
-- Ask clarifying questions or follow-up questions when relevant (not EVERY message) to keep the conversation engaging and natural. 
-Those questions should be relevant to the conversation and the user's query, and help you to learn more about the user's business and needs, to help them most effectively.
-"""
-
-        messages.append({
+        messages = [{
             "role": "system",
-            "content": system_prompt,
-        })
+            "content": self.build_system_prompt(
+                clone_name=clone_name,
+                rag_context=rag_context,
+                style_instructions=style_instructions,
+            ),
+        }]
 
         # Add conversation history (last 10 messages for context) - copied from ChatService
-        if conversation_history:
-            recent_history = conversation_history[-10:] if len(conversation_history) > 10 else conversation_history
-            for msg in recent_history:
-                role = "user" if msg.role == "external_user" else "assistant"
-                messages.append({
-                    "role": role,
-                    "content": msg.content,
-                })
+        messages.extend(
+            {"role": "user" if msg.role == "external_user" else "assistant", "content": msg.content}
+            for msg in (conversation_history or ())[-MAX_HISTORY_MESSAGES:]
+        )
 
         # Add current message
         messages.append({
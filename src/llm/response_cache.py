@@ -0,0 +1,100 @@
+"""Two-tier (in-process LRU + optional Redis) cache for LLM responses"""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Responses are only cached for (near-)deterministic sampling
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+DEFAULT_TTL_SECONDS = 3600
+LOCAL_CACHE_SIZE = 1024
+REDIS_KEY_PREFIX = "llm_response:"
+
+
+def make_cache_key(*parts: object) -> str:
+    """Build a cache key from the parts that determine a response"""
+    return hashlib.blake2b("|".join(str(part) for part in parts).encode("utf-8"), digest_size=32).hexdigest()
+
+
+class ResponseCache:
+    """Response cache with a local LRU tier in front of an optional shared Redis tier.
+
+    The local tier saves a Redis round-trip for repeat queries on the same worker;
+    Redis (enabled when REDIS_URL is set and the redis package is installed) shares
+    responses across workers. Redis errors are logged and treated as misses.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, maxsize: int = LOCAL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.redis = None
+
+        redis_url = redis_url or settings.redis_url
+        if redis_url:
+            try:
+                import redis
+                self.redis = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+            except ImportError:
+                logger.warning("redis package not installed, using local response cache only")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._local.move_to_end(key)
+                    return value
+                del self._local[key]
+
+        if self.redis is None:
+            return None
+
+        try:
+            value = self.redis.get(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis cache get failed", error=str(e))
+            return None
+        if value is None:
+            return None
+
+        value = value.decode("utf-8")
+        # Redis doesn't tell us the remaining TTL here; keep it locally for the full TTL
+        self._set_local(key, value, DEFAULT_TTL_SECONDS)
+        return value
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        """Store value under key in both tiers"""
+        self._set_local(key, value, ttl)
+
+        if self.redis is None:
+            return
+
+        try:
+            self.redis.setex(REDIS_KEY_PREFIX + key, ttl, value)
+        except Exception as e:
+            logger.warning("Redis cache set failed", error=str(e))
+
+    def _set_local(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + ttl, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Process-wide response cache shared by all PromptBuilders"""
+    return ResponseCache()
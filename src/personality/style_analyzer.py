@@ -3,9 +3,9 @@
 # TODO: Understand where and how to use. Update logic accordingly.
 
 import re
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
 from collections import Counter
-import statistics
 
 from src.personality.profile import PersonalityProfile, CommunicationStyle
 from src.utils.logging import get_logger
@@ -13,6 +13,124 @@ from src.utils.aws import save_personality_profile_to_s3, load_personality_profi
 
 logger = get_logger(__name__)
 
+# Tables and patterns used for every analyzed text, built once
+# Sentence terminators folded onto '.', so one str.split('.') splits on all of them
+SENTENCE_END_TRANSLATION = str.maketrans('!?', '..')
+PUNCTUATION_MARKS = '.,!?;:—'
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Style and tone signals saturate well before this much text; larger corpora are sampled
+MAX_ANALYSIS_CHARS = 1_000_000
+
+# Keyword tables for the style and tone heuristics (whole-word matches, lowercase, immutable)
+DECISION_KEYWORDS = {
+    "analytical": ("analyze", "consider", "evaluate", "assess", "examine"),
+    "intuitive": ("feel", "sense", "intuition", "gut", "instinct"),
+    "collaborative": ("we", "team", "together", "collaborate", "discuss"),
+    "decisive": ("decide", "choose", "determine", "conclude", "final"),
+}
+DETAIL_INDICATORS = {
+    "high": ("detailed", "comprehensive", "thorough", "in-depth", "extensive"),
+    "low": ("brief", "summary", "overview", "high-level", "quick"),
+}
+DIRECTNESS_INDICATORS = {
+    "direct": ("clearly", "obviously", "definitely", "certainly", "absolutely"),
+    "indirect": ("perhaps", "maybe", "might", "could", "possibly"),
+}
+FORMALITY_INDICATORS = {
+    "formal": ("therefore", "furthermore", "moreover", "consequently", "accordingly"),
+    "casual": ("hey", "yeah", "gonna", "wanna", "gotta"),
+}
+TONE_KEYWORDS = {
+    "positive": ("great", "excellent", "good", "wonderful", "amazing", "fantastic"),
+    "negative": ("bad", "terrible", "awful", "horrible", "worst", "disappointing"),
+    "neutral": ("okay", "fine", "acceptable", "adequate", "sufficient"),
+    "professional": ("please", "thank you", "appreciate", "regards", "sincerely"),
+    "friendly": ("hi", "hello", "hey", "thanks", "cheers", "best"),
+}
+
+
+# Keywords that span several word tokens ("thank you", "in-depth") can't be looked
+# up in a word Counter, so they are matched as whole phrases instead
+PHRASE_KEYWORD_RES = {
+    keyword: re.compile(r'\b' + re.escape(keyword) + r'\b')
+    for groups in (DECISION_KEYWORDS, DETAIL_INDICATORS, DIRECTNESS_INDICATORS, FORMALITY_INDICATORS, TONE_KEYWORDS)
+    for keywords in groups.values()
+    for keyword in keywords
+    if not WORD_RE.fullmatch(keyword)
+}
+
+
+def _sample_texts(texts: List[str], max_chars: int) -> List[str]:
+    """Deterministically pick evenly spaced texts totalling roughly max_chars"""
+    total_chars = sum(map(len, texts))
+    if total_chars <= max_chars:
+        return texts
+    stride = total_chars / max_chars
+    sample_size = max(1, int(len(texts) / stride))
+    return [texts[int(i * stride)] for i in range(sample_size)]
+
+
+@dataclass
+class TextStats:
+    """Everything the analyzers need from the corpus, gathered in one pass over the texts"""
+    lower_texts: List[str] = field(default_factory=list)
+    words: List[str] = field(default_factory=list)  # WORD_RE tokens of the lowercased texts
+    keyword_counts: Counter = field(default_factory=Counter)  # word tokens plus phrase keywords
+    sentence_count: int = 0
+    sentence_word_total: int = 0
+    punctuation_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(PUNCTUATION_MARKS, 0))
+    paragraph_count: int = 0
+    paragraph_word_total: int = 0
+    total_chars: int = 0
+
+
+def _scan_texts(texts: List[str]) -> TextStats:
+    """Lowercase, tokenize and tally every text once (no joined corpus copy)"""
+    stats = TextStats()
+    phrase_counts = dict.fromkeys(PHRASE_KEYWORD_RES, 0)
+    
+    for text in texts:
+        stats.total_chars += len(text)
+        
+        # Lowercase and tokenize once; keyword and phrase analyses work on lowercase text
+        text_lower = text.lower()
+        stats.lower_texts.append(text_lower)
+        stats.words.extend(WORD_RE.findall(text_lower))
+        for phrase, pattern in PHRASE_KEYWORD_RES.items():
+            phrase_counts[phrase] += len(pattern.findall(text_lower))
+        
+        # Sentences (running totals, no per-sentence lists)
+        # Runs of terminators leave empty pieces, which the word count skips
+        for sentence in text.translate(SENTENCE_END_TRANSLATION).split('.'):
+            word_count = len(sentence.split())
+            if word_count:
+                stats.sentence_count += 1
+                stats.sentence_word_total += word_count
+        
+        # Paragraphs
+        for paragraph in text.split('\n\n'):
+            word_count = len(paragraph.split())
+            if word_count:
+                stats.paragraph_count += 1
+                stats.paragraph_word_total += word_count
+        
+        # Punctuation (includes the ? and ! used for question/exclamation frequency)
+        for punct in PUNCTUATION_MARKS:
+            stats.punctuation_counts[punct] += text.count(punct)
+    
+    stats.keyword_counts = Counter(stats.words)
+    stats.keyword_counts.update(phrase_counts)
+    return stats
+
+
+def _count_keywords(keyword_counts: Counter, keyword_groups: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    """Sum whole-word occurrences of each group's keywords"""
+    return {
+        group: sum(keyword_counts[keyword] for keyword in keywords)
+        for group, keywords in keyword_groups.items()
+    }
+
 
 class StyleAnalyzer:
     """Analyzer for extracting communication style and personality traits"""
@@ -28,20 +146,27 @@ class StyleAnalyzer:
         
         logger.info("Analyzing texts for personality", text_count=len(texts))
         
-        # Combine all texts
-        combined_text = " ".join(texts)
+        # Bound the analysis cost for very large corpora (data_sources_count still
+        # reports every text)
+        sources_count = len(texts)
+        texts = _sample_texts(texts, MAX_ANALYSIS_CHARS)
+        if len(texts) < sources_count:
+            logger.info("Sampling texts for analysis", sampled_count=len(texts), max_chars=MAX_ANALYSIS_CHARS)
+        
+        # Single pass over the corpus; the analyzers below only aggregate its results
+        stats = _scan_texts(texts)
         
         # Analyze communication style
-        communication_style = self._analyze_communication_style(texts)
+        communication_style = self._analyze_communication_style(stats)
         
         # Analyze writing patterns
-        writing_patterns = self._analyze_writing_patterns(texts)
+        writing_patterns = self._analyze_writing_patterns(stats)
         
         # Analyze tone
-        tone_characteristics = self._analyze_tone(combined_text)
+        tone_characteristics = self._analyze_tone(stats.keyword_counts)
         
         # Extract common phrases
-        common_phrases = self._extract_common_phrases(texts)
+        common_phrases = self._extract_common_phrases(stats.lower_texts)
         
         # Update communication style with common phrases
         communication_style.common_phrases = common_phrases
@@ -51,73 +176,31 @@ class StyleAnalyzer:
             communication_style=communication_style,
             writing_patterns=writing_patterns,
             tone_characteristics=tone_characteristics,
-            data_sources_count=len(texts),
+            data_sources_count=sources_count,
         )
         
         self.profile = profile
         logger.info("Personality analysis completed")
         return profile
     
-    def _analyze_communication_style(self, texts: List[str]) -> CommunicationStyle:
-        """Analyze communication style from texts"""
-        all_sentences = []
-        punctuation_counts = Counter()
-        decision_keywords = {
-            "analytical": ["analyze", "consider", "evaluate", "assess", "examine"],
-            "intuitive": ["feel", "sense", "intuition", "gut", "instinct"],
-            "collaborative": ["we", "team", "together", "collaborate", "discuss"],
-            "decisive": ["decide", "choose", "determine", "conclude", "final"],
-        }
+    def _analyze_communication_style(self, stats: TextStats) -> CommunicationStyle:
+        """Analyze communication style from corpus stats"""
+        keyword_counts = stats.keyword_counts
+        punctuation_counts = stats.punctuation_counts
         
-        decision_scores = {key: 0 for key in decision_keywords}
-        detail_indicators = {
-            "high": ["detailed", "comprehensive", "thorough", "in-depth", "extensive"],
-            "low": ["brief", "summary", "overview", "high-level", "quick"],
-        }
-        detail_scores = {key: 0 for key in detail_indicators}
-        directness_indicators = {
-            "direct": ["clearly", "obviously", "definitely", "certainly", "absolutely"],
-            "indirect": ["perhaps", "maybe", "might", "could", "possibly"],
-        }
-        directness_scores = {key: 0 for key in directness_indicators}
-        
-        for text in texts:
-            # Split into sentences
-            sentences = re.split(r'[.!?]+', text)
-            all_sentences.extend([s.strip() for s in sentences if s.strip()])
-            
-            # Count punctuation
-            punctuation_counts.update(re.findall(r'[.,!?;:—]', text))
-            
-            text_lower = text.lower()
-            
-            # Analyze decision-making style
-            for style, keywords in decision_keywords.items():
-                for keyword in keywords:
-                    decision_scores[style] += text_lower.count(keyword)
-            
-            # Analyze detail level
-            for level, indicators in detail_indicators.items():
-                for indicator in indicators:
-                    detail_scores[level] += text_lower.count(indicator)
-            
-            # Analyze directness
-            for level, indicators in directness_indicators.items():
-                for indicator in indicators:
-                    directness_scores[level] += text_lower.count(indicator)
+        # Keyword scores are word-count lookups
+        decision_scores = _count_keywords(keyword_counts, DECISION_KEYWORDS)
+        detail_scores = _count_keywords(keyword_counts, DETAIL_INDICATORS)
+        directness_scores = _count_keywords(keyword_counts, DIRECTNESS_INDICATORS)
         
         # Calculate average sentence length
-        sentence_lengths = [len(s.split()) for s in all_sentences if s]
-        avg_sentence_length = statistics.mean(sentence_lengths) if sentence_lengths else 15.0
+        avg_sentence_length = (
+            stats.sentence_word_total / stats.sentence_count if stats.sentence_count else 15.0
+        )
         
         # Determine formality (simple heuristic based on sentence structure and vocabulary)
-        formal_indicators = ["therefore", "furthermore", "moreover", "consequently", "accordingly"]
-        casual_indicators = ["hey", "yeah", "gonna", "wanna", "gotta"]
-        formality_score = 0
-        for text in texts:
-            text_lower = text.lower()
-            formality_score += sum(text_lower.count(ind) for ind in formal_indicators)
-            formality_score -= sum(text_lower.count(ind) for ind in casual_indicators)
+        formality_counts = _count_keywords(keyword_counts, FORMALITY_INDICATORS)
+        formality_score = formality_counts["formal"] - formality_counts["casual"]
         
         if formality_score > 5:
             formality = "formal"
@@ -147,6 +230,7 @@ class StyleAnalyzer:
         punctuation_style = {
             punct: count / total_punctuation if total_punctuation > 0 else 0
             for punct, count in punctuation_counts.items()
+            if count
         }
         
         return CommunicationStyle(
@@ -158,8 +242,8 @@ class StyleAnalyzer:
             directness=directness,
         )
     
-    def _analyze_writing_patterns(self, texts: List[str]) -> Dict:
-        """Analyze writing patterns"""
+    def _analyze_writing_patterns(self, stats: TextStats) -> Dict:
+        """Analyze writing patterns from corpus stats"""
         patterns = {
             "avg_word_length": 0,
             "avg_paragraph_length": 0,
@@ -167,53 +251,21 @@ class StyleAnalyzer:
             "exclamation_frequency": 0,
         }
         
-        all_words = []
-        paragraphs = []
-        question_count = 0
-        exclamation_count = 0
-        
-        for text in texts:
-            # Word analysis
-            words = re.findall(r'\b\w+\b', text)
-            all_words.extend(words)
-            
-            # Paragraph analysis
-            text_paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-            paragraphs.extend(text_paragraphs)
-            
-            # Question and exclamation
-            question_count += len(re.findall(r'\?', text))
-            exclamation_count += len(re.findall(r'!', text))
-        
-        if all_words:
-            patterns["avg_word_length"] = statistics.mean([len(w) for w in all_words])
-        
-        if paragraphs:
-            patterns["avg_paragraph_length"] = statistics.mean([len(p.split()) for p in paragraphs])
-        
-        total_chars = sum(len(t) for t in texts)
-        if total_chars > 0:
-            patterns["question_frequency"] = question_count / (total_chars / 1000)
-            patterns["exclamation_frequency"] = exclamation_count / (total_chars / 1000)
+        if stats.words:
+            patterns["avg_word_length"] = sum(map(len, stats.words)) / len(stats.words)
         
-        return patterns
-    
-    def _analyze_tone(self, text: str) -> Dict[str, float]:
-        """Analyze tone characteristics"""
-        tone_keywords = {
-            "positive": ["great", "excellent", "good", "wonderful", "amazing", "fantastic"],
-            "negative": ["bad", "terrible", "awful", "horrible", "worst", "disappointing"],
-            "neutral": ["okay", "fine", "acceptable", "adequate", "sufficient"],
-            "professional": ["please", "thank you", "appreciate", "regards", "sincerely"],
-            "friendly": ["hi", "hello", "hey", "thanks", "cheers", "best"],
-        }
+        if stats.paragraph_count:
+            patterns["avg_paragraph_length"] = stats.paragraph_word_total / stats.paragraph_count
         
-        text_lower = text.lower()
-        tone_scores = {}
+        if stats.total_chars > 0:
+            patterns["question_frequency"] = stats.punctuation_counts["?"] / (stats.total_chars / 1000)
+            patterns["exclamation_frequency"] = stats.punctuation_counts["!"] / (stats.total_chars / 1000)
         
-        for tone, keywords in tone_keywords.items():
-            score = sum(text_lower.count(keyword) for keyword in keywords)
-            tone_scores[tone] = score
+        return patterns
+    
+    def _analyze_tone(self, keyword_counts: Counter) -> Dict[str, float]:
+        """Analyze tone characteristics from keyword counts"""
+        tone_scores = _count_keywords(keyword_counts, TONE_KEYWORDS)
         
         # Normalize scores
         total = sum(tone_scores.values())
@@ -222,24 +274,17 @@ class StyleAnalyzer:
         
         return tone_scores
     
-    def _extract_common_phrases(self, texts: List[str], min_occurrences: int = 3) -> List[str]:
-        """Extract commonly used phrases"""
-        # Simple bigram extraction
-        phrases = []
-        for text in texts:
-            words = text.lower().split()
-            for i in range(len(words) - 1):
-                phrase = f"{words[i]} {words[i+1]}"
-                phrases.append(phrase)
-        
-        phrase_counts = Counter(phrases)
-        common_phrases = [
-            phrase for phrase, count in phrase_counts.items()
-            if count >= min_occurrences
-        ]
+    def _extract_common_phrases(self, lower_texts: List[str], min_occurrences: int = 3) -> List[str]:
+        """Extract commonly used phrases from lowercased texts"""
+        # Simple bigram extraction: count word-pair tuples, and only build strings
+        # for the phrases that are returned
+        bigram_counts = Counter()
+        for text in lower_texts:
+            words = text.split()
+            bigram_counts.update(zip(words, words[1:]))
         
         # Return top 20 most common
-        return [p[0] for p in phrase_counts.most_common(20)]
+        return [f"{first} {second}" for (first, second), _ in bigram_counts.most_common(20)]
     
     def update_profile_from_new_data(self, new_texts: List[str]) -> PersonalityProfile:
         """Update existing profile with new data"""
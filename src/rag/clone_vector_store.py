@@ -1,7 +1,10 @@
 """Clone-scoped vector store wrapper that enforces tenant_id and clone_id isolation using Pinecone namespaces"""
 
+import functools
 from typing import List, Dict, Optional
 from uuid import UUID
+from pinecone.exceptions import NotFoundException
+from src.config.settings import settings
 from src.rag.pinecone_store import PineconeStore
 from src.rag.utils import validate_metadata
 from src.utils.logging import get_logger
@@ -45,14 +48,21 @@ class CloneVectorStore:
         self.tenant_id = tenant_id
         self.base_store = base_store or PineconeStore()
         
+        # String forms are used on every operation (logging and validation); convert once
+        self._clone_id_str = str(clone_id)
+        self._tenant_id_str = str(tenant_id)
+        
         # Create namespace from tenant_id and clone_id for infrastructure-level isolation
         # Format: "{tenant_id}_{clone_id}" (UUIDs converted to strings without dashes for cleaner namespace names)
-        self.namespace = f"{str(tenant_id).replace('-', '')}_{str(clone_id).replace('-', '')}"
+        self.namespace = f"{self._tenant_id_str.replace('-', '')}_{self._clone_id_str.replace('-', '')}"
+        
+        # IDs stamped onto every stored vector's metadata
+        self._id_metadata = {"tenant_id": self._tenant_id_str, "clone_id": self._clone_id_str}
         
         logger.info(
             "CloneVectorStore initialized",
-            clone_id=str(clone_id),
-            tenant_id=str(tenant_id),
+            clone_id=self._clone_id_str,
+            tenant_id=self._tenant_id_str,
             namespace=self.namespace
         )
     
@@ -68,7 +78,33 @@ class CloneVectorStore:
         Returns:
             Validated metadata dictionary with tenant_id and clone_id ensured
         """
-        return validate_metadata(metadata, self.tenant_id, self.clone_id, metadata_index)
+        return validate_metadata(metadata, self._tenant_id_str, self._clone_id_str, metadata_index)
+    
+    def _private_validated_metadata(self, metadata: Dict, metadata_index: int) -> Dict:
+        """Validate metadata, returning a new dict even when it needed no changes"""
+        validated = self._validate_metadata(metadata, metadata_index=metadata_index)
+        return dict(validated) if validated is metadata else validated
+    
+    def _search_filter(self, filter_metadata: Optional[Dict]) -> Optional[Dict]:
+        """
+        Validate a search filter (its IDs must match this clone) and return the filter to send.
+        The tenant_id/clone_id conditions are kept, so Pinecone checks them on top of the
+        namespace, unless PINECONE_STRIP_NAMESPACE_ID_FILTERS is set: every vector in this
+        namespace carries this clone's IDs, so dropping them saves filter work at the cost
+        of that second check.
+        """
+        if not filter_metadata:
+            return None
+        # Validate filter_metadata (ensures IDs match this clone)
+        self._validate_metadata(filter_metadata)
+        if not settings.pinecone_strip_namespace_id_filters:
+            return filter_metadata
+        return {key: value for key, value in filter_metadata.items() if key not in self._id_metadata} or None
+    
+    def _invalidate_search_cache(self) -> None:
+        """Drop the retriever's cached search results for this namespace"""
+        from src.rag.retriever import invalidate_search_cache
+        invalidate_search_cache(self.namespace)
     
     def search(
         self,
@@ -91,13 +127,12 @@ class CloneVectorStore:
         """
         # Validate filter_metadata if provided (ensures IDs match this clone)
         # This validation ensures we know which namespace to use and verifies data integrity
-        if filter_metadata:
-            self._validate_metadata(filter_metadata)
+        filter_metadata = self._search_filter(filter_metadata)
         
         logger.debug(
             "Searching in clone namespace",
-            clone_id=str(self.clone_id),
-            tenant_id=str(self.tenant_id),
+            clone_id=self._clone_id_str,
+            tenant_id=self._tenant_id_str,
             namespace=self.namespace,
             query_preview=query[:50]
         )
@@ -111,8 +146,45 @@ class CloneVectorStore:
             filter_metadata=filter_metadata,
             namespace=self.namespace,  # ALWAYS provided - never None
             validate_tenant_clone_ids=True,  # ALWAYS enabled for clone-scoped operations
-            expected_tenant_id=str(self.tenant_id),
-            expected_clone_id=str(self.clone_id),
+            expected_tenant_id=self._tenant_id_str,
+            expected_clone_id=self._clone_id_str,
+        )
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 5,
+        filter_metadata: Optional[Dict] = None,
+    ) -> List[List[Dict]]:
+        """
+        Search for several queries within this clone's namespace with a single embedding request.
+        
+        Args:
+            queries: Search query strings
+            n_results: Number of results to return per query
+            filter_metadata: Optional additional metadata filters (applied to every query)
+        
+        Returns:
+            One list of search results per query, in query order
+        """
+        filter_metadata = self._search_filter(filter_metadata)
+        
+        logger.debug(
+            "Batch searching in clone namespace",
+            clone_id=self._clone_id_str,
+            tenant_id=self._tenant_id_str,
+            namespace=self.namespace,
+            query_count=len(queries)
+        )
+        
+        return self.base_store.search_batch(
+            queries=queries,
+            n_results=n_results,
+            filter_metadata=filter_metadata,
+            namespace=self.namespace,  # ALWAYS provided - never None
+            validate_tenant_clone_ids=True,  # ALWAYS enabled for clone-scoped operations
+            expected_tenant_id=self._tenant_id_str,
+            expected_clone_id=self._clone_id_str,
         )
     
     def add_texts(
@@ -142,16 +214,21 @@ class CloneVectorStore:
             metadatas = [{} for _ in texts]
         
         # Validate and ensure tenant_id and clone_id are in each metadata
-        # This validation ensures we know which namespace to use and verifies data integrity
-        validated_metadatas = []
-        for i, metadata in enumerate(metadatas):
-            validated_metadata = self._validate_metadata(metadata, metadata_index=i)
-            validated_metadatas.append(validated_metadata)
+        # This validation ensures we know which namespace to use and verifies data integrity.
+        # Metadata without IDs (the common case) has nothing to check, so the IDs are just merged in.
+        # The base store takes ownership of these dicts (it adds the text in place), so each is a
+        # new dict rather than the caller's.
+        validated_metadatas = [
+            self._private_validated_metadata(metadata, i)
+            if metadata and ("tenant_id" in metadata or "clone_id" in metadata)
+            else {**(metadata or {}), **self._id_metadata}
+            for i, metadata in enumerate(metadatas)
+        ]
         
         logger.debug(
             "Adding texts to clone namespace",
-            clone_id=str(self.clone_id),
-            tenant_id=str(self.tenant_id),
+            clone_id=self._clone_id_str,
+            tenant_id=self._tenant_id_str,
             namespace=self.namespace,
             text_count=len(texts)
         )
@@ -159,15 +236,18 @@ class CloneVectorStore:
         # Call base store with namespace ALWAYS provided and validation enabled
         # Namespace ensures infrastructure-level isolation
         # Validation ensures metadata matches expected IDs (double-check)
-        return self.base_store.add_texts(
-            texts=texts,
-            metadatas=validated_metadatas,
-            ids=ids,
-            namespace=self.namespace,  # ALWAYS provided - never None
-            validate_tenant_clone_ids=True,  # ALWAYS enabled for clone-scoped operations
-            expected_tenant_id=str(self.tenant_id),
-            expected_clone_id=str(self.clone_id),
-        )
+        try:
+            return self.base_store.add_texts(
+                texts=texts,
+                metadatas=validated_metadatas,
+                ids=ids,
+                namespace=self.namespace,  # ALWAYS provided - never None
+                validate_tenant_clone_ids=True,  # ALWAYS enabled for clone-scoped operations
+                expected_tenant_id=self._tenant_id_str,
+                expected_clone_id=self._clone_id_str,
+            )
+        finally:
+            self._invalidate_search_cache()
     
     def delete(
         self,
@@ -193,8 +273,8 @@ class CloneVectorStore:
         
         logger.debug(
             "Deleting from clone namespace",
-            clone_id=str(self.clone_id),
-            tenant_id=str(self.tenant_id),
+            clone_id=self._clone_id_str,
+            tenant_id=self._tenant_id_str,
             namespace=self.namespace,
             ids_count=len(ids) if ids else 0
         )
@@ -202,14 +282,17 @@ class CloneVectorStore:
         # Call base store with namespace ALWAYS provided and validation enabled
         # Namespace ensures infrastructure-level isolation
         # Validation ensures filter_metadata matches expected IDs (double-check)
-        return self.base_store.delete(
-            ids=ids,
-            filter_metadata=filter_metadata,
-            namespace=self.namespace,  # ALWAYS provided - never None
-            validate_tenant_clone_ids=True,  # ALWAYS enabled for clone-scoped operations
-            expected_tenant_id=str(self.tenant_id),
-            expected_clone_id=str(self.clone_id),
-        )
+        try:
+            return self.base_store.delete(
+                ids=ids,
+                filter_metadata=filter_metadata,
+                namespace=self.namespace,  # ALWAYS provided - never None
+                validate_tenant_clone_ids=True,  # ALWAYS enabled for clone-scoped operations
+                expected_tenant_id=self._tenant_id_str,
+                expected_clone_id=self._clone_id_str,
+            )
+        finally:
+            self._invalidate_search_cache()
     
     def get_collection_count(self) -> int:
         """
@@ -231,8 +314,8 @@ class CloneVectorStore:
         
         logger.warning(
             "Resetting clone namespace",
-            clone_id=str(self.clone_id),
-            tenant_id=str(self.tenant_id),
+            clone_id=self._clone_id_str,
+            tenant_id=self._tenant_id_str,
             namespace=self.namespace
         )
         
@@ -241,29 +324,27 @@ class CloneVectorStore:
             f"⚠️  Resetting clone namespace in PRODUCTION: This will delete all vectors for clone {self.clone_id} "
             f"in namespace '{self.namespace}'. This operation cannot be undone."
         )
-        # Delete all vectors in this namespace by querying and deleting
-        # Use a dummy query to get all vectors in the namespace
-        from src.rag.embeddings import EmbeddingService
-        embedding_service = EmbeddingService()
-        dummy_embedding = [0.0] * embedding_service.get_embedding_dimension()
-        
+        self._invalidate_search_cache()
         try:
-            # Query all vectors in namespace
-            results = self.base_store.index.query(
-                vector=dummy_embedding,
-                top_k=10000,  # Maximum reasonable limit
-                include_metadata=False,
-                namespace=self.namespace,
-            )
-            
-            if results.matches:
-                ids_to_delete = [match.id for match in results.matches]
-                self.base_store.index.delete(ids=ids_to_delete, namespace=self.namespace)
-                logger.info("Clone namespace reset", namespace=self.namespace, vectors_deleted=len(ids_to_delete))
-                return True
-            else:
-                logger.info("No vectors found in namespace", namespace=self.namespace)
-                return True
+            # Namespace-level delete_all is a single server-side operation; no need to
+            # enumerate vector IDs with a query first
+            self.base_store.index.delete(delete_all=True, namespace=self.namespace)
+            logger.info("Clone namespace reset", namespace=self.namespace)
+            return True
+        except NotFoundException:
+            # Serverless indexes report a namespace with no vectors as not found
+            logger.info("No vectors found in namespace", namespace=self.namespace)
+            return True
         except Exception as e:
             logger.error("Error resetting clone namespace", error=str(e), namespace=self.namespace)
             return False
+
+
+@functools.lru_cache(maxsize=256)
+def get_clone_vector_store(clone_id: UUID, tenant_id: UUID) -> CloneVectorStore:
+    """Shared CloneVectorStore per clone.
+
+    The store holds no per-request state (just the IDs, namespace and the shared
+    PineconeStore), so requests for the same clone reuse one instead of building it each time.
+    """
+    return CloneVectorStore(clone_id=clone_id, tenant_id=tenant_id)
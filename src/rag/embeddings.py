@@ -1,54 +1,264 @@
 """Embedding generation using OpenAI API"""
 
-from typing import List, Optional
-from openai import OpenAI
+import asyncio
+import functools
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from openai import OpenAI, AsyncOpenAI
 
 from src.config.settings import settings
+from src.llm.client import get_async_openai_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Embedding batch requests in flight at once (keeps bursts within OpenAI rate limits)
+MAX_CONCURRENT_EMBEDDING_BATCHES = 8
+
+# Embeddings kept in memory (packed float32: 6KB or 12KB each depending on model dimension)
+EMBEDDING_CACHE_SIZE = 10_000
+
+
+class EmbeddingCache:
+    """Bounded in-process LRU of embeddings keyed by a (model, text) hash.
+    
+    Entries are held as packed float32 arrays (4 bytes per value instead of a
+    boxed Python float) and handed out as fresh lists. When db_path is set,
+    embeddings are also written through to a SQLite file (as float16, half the
+    size of float32 with negligible similarity error), so they survive process
+    restarts; memory misses fall back to it.
+    """
+    
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE, db_path: Optional[str] = None):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, array]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Access is serialized by self._lock
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+            self._db.commit()
+    
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """Fixed-size key so cached texts aren't kept in memory"""
+        return hashlib.blake2b(f"{model}\x00{text}".encode("utf-8"), digest_size=16).digest()
+    
+    @staticmethod
+    def _pack(embedding: List[float]) -> bytes:
+        return struct.pack(f"<{len(embedding)}e", *embedding)
+    
+    @staticmethod
+    def _unpack(data: bytes) -> List[float]:
+        return list(struct.unpack(f"<{len(data) // 2}e", data))
+    
+    def get(self, key: bytes) -> Optional[List[float]]:
+        with self._lock:
+            packed = self._entries.get(key)
+            if packed is not None:
+                self._entries.move_to_end(key)
+                return packed.tolist()
+            
+            if self._db is None:
+                return None
+            row = self._db.execute("SELECT embedding FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            embedding = self._unpack(row[0])
+            self._remember(key, embedding)
+            return embedding
+    
+    def set(self, key: bytes, embedding: List[float]) -> None:
+        self.set_many([(key, embedding)])
+    
+    def set_many(self, items: List[Tuple[bytes, List[float]]]) -> None:
+        """Store several embeddings (one disk transaction)"""
+        with self._lock:
+            for key, embedding in items:
+                self._remember(key, embedding)
+            
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                        [(key, self._pack(embedding)) for key, embedding in items],
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    # The disk tier is best-effort; the in-memory entries are still valid
+                    logger.warning("Could not persist embeddings", error=str(e))
+    
+    def _remember(self, key: bytes, embedding: List[float]) -> None:
+        """Add to the in-memory LRU (caller holds the lock)"""
+        # OpenAI embeddings are float32 values, so packing them is lossless
+        self._entries[key] = array("f", embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Shared by all EmbeddingService instances in the process
+_embedding_cache = EmbeddingCache(db_path=settings.embedding_cache_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> OpenAI:
+    """Shared OpenAI client per API key, so every EmbeddingService reuses one keep-alive pool"""
+    return OpenAI(api_key=api_key)
+
 
 class EmbeddingService:
     """Service for generating embeddings using OpenAI"""
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    # Overrides the shared async client when set (e.g. in tests)
+    _async_client: Optional[AsyncOpenAI] = None
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
+    ):
         self.api_key = api_key or settings.openai_api_key
         self.model = model or settings.openai_embedding_model
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = _get_client(self.api_key)
+        self.cache = cache if cache is not None else _embedding_cache
     
     def embed_text(self, text: str) -> List[float]:
-        """Generate embedding for a single text"""
+        """Generate embedding for a single text (served from cache when seen before)"""
+        key = self.cache.key(self.model, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.client.embeddings.create(
                 model=self.model,
                 input=text,
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
         except Exception as e:
             logger.error("Error generating embedding", error=str(e), text_preview=text[:100])
             raise
+        
+        self.cache.set(key, embedding)
+        return embedding
+    
+    def _lookup_cached(self, texts: List[str]) -> Tuple[List[bytes], List[Optional[List[float]]], Dict[bytes, str]]:
+        """Split texts into cached embeddings and the unique texts that still need embedding.
+        
+        Returns (keys, embeddings with None for misses, {key: text} of unique misses).
+        """
+        keys = [self.cache.key(self.model, text) for text in texts]
+        embeddings = [self.cache.get(key) for key in keys]
+        missing: Dict[bytes, str] = {}
+        for key, text, embedding in zip(keys, texts, embeddings):
+            if embedding is None:
+                missing.setdefault(key, text)
+        return keys, embeddings, missing
+    
+    def _fill_missing(
+        self,
+        keys: List[bytes],
+        embeddings: List[Optional[List[float]]],
+        missing: Dict[bytes, str],
+        new_embeddings: List[List[float]],
+    ) -> List[List[float]]:
+        """Cache freshly generated embeddings and scatter them back to every position"""
+        by_key = dict(zip(missing, new_embeddings))
+        # Failed batches come back as [] and must not be cached
+        self.cache.set_many([(key, embedding) for key, embedding in by_key.items() if embedding])
+        return [
+            embedding if embedding is not None else by_key[key]
+            for key, embedding in zip(keys, embeddings)
+        ]
     
     def embed_texts(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
-        """Generate embeddings for multiple texts with batching"""
-        all_embeddings = []
+        """Generate embeddings for multiple texts, skipping cached and duplicate texts"""
+        keys, embeddings, missing = self._lookup_cached(texts)
+        if not missing:
+            return embeddings
+        
+        new_embeddings = self._embed_uncached(list(missing.values()), batch_size)
+        return self._fill_missing(keys, embeddings, missing, new_embeddings)
+    
+    def _embed_uncached(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """Embed texts via the API, sending batches concurrently"""
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) <= 1:
+            batch_results = [self._embed_batch(batch, 0) for batch in batches]
+        else:
+            # The OpenAI client is thread-safe; map() keeps results in batch order
+            with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_EMBEDDING_BATCHES)) as executor:
+                batch_results = list(executor.map(
+                    self._embed_batch,
+                    batches,
+                    range(0, len(texts), batch_size),
+                ))
+        
+        return [embedding for batch_embeddings in batch_results for embedding in batch_embeddings]
+    
+    def _embed_batch(self, batch: List[str], batch_start: int) -> List[List[float]]:
+        """Embed one batch; a failed batch yields empty embeddings so other batches still succeed"""
+        try:
+            response = self.client.embeddings.create(
+                model=self.model,
+                input=batch,
+            )
+            logger.debug("Generated embeddings for batch", batch_size=len(batch), batch_start=batch_start)
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            logger.error("Error generating embeddings for batch", error=str(e), batch_start=batch_start)
+            return [[]] * len(batch)
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The AsyncOpenAI client shared with every other caller using this API key"""
+        return self._async_client or get_async_openai_client(self.api_key)
+    
+    async def embed_texts_async(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
+        """Generate embeddings for multiple texts without blocking the event loop"""
+        keys, embeddings, missing = self._lookup_cached(texts)
+        if not missing:
+            return embeddings
+        texts = list(missing.values())
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_BATCHES)
+        
+        async def embed_batch(batch: List[str], batch_start: int) -> List[List[float]]:
+            async with semaphore:
+                try:
+                    response = await self.async_client.embeddings.create(
+                        model=self.model,
+                        input=batch,
+                    )
+                    logger.debug("Generated embeddings for batch", batch_size=len(batch), batch_start=batch_start)
+                    return [item.embedding for item in response.data]
+                except Exception as e:
+                    logger.error("Error generating embeddings for batch", error=str(e), batch_start=batch_start)
+                    return [[]] * len(batch)
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            try:
-                response = self.client.embeddings.create(
-                    model=self.model,
-                    input=batch,
-                )
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
-                logger.debug("Generated embeddings for batch", batch_size=len(batch), total=len(all_embeddings))
-            except Exception as e:
-                logger.error("Error generating embeddings for batch", error=str(e), batch_start=i)
-                # Continue with next batch
-                all_embeddings.extend([[]] * len(batch))
+        # gather() returns results in submission order
+        batch_results = await asyncio.gather(*[
+            embed_batch(texts[i:i + batch_size], i)
+            for i in range(0, len(texts), batch_size)
+        ])
         
-        return all_embeddings
+        new_embeddings = [embedding for batch_embeddings in batch_results for embedding in batch_embeddings]
+        return self._fill_missing(keys, embeddings, missing, new_embeddings)
     
     def get_embedding_dimension(self) -> int:
         """Get the dimension of embeddings for this model"""
@@ -1,14 +1,72 @@
 """Pinecone Serverless vector store wrapper"""
 
-from typing import List, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Iterable, List, Dict, Optional
+import functools
+import time
 import uuid
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.exceptions import NotFoundException, PineconeApiException
+
+try:
+    # Optional: pip install "pinecone[grpc]" (protobuf payloads over multiplexed HTTP/2)
+    from pinecone.grpc import PineconeGRPC
+except ImportError:
+    PineconeGRPC = None
 from src.config.settings import settings
 from src.rag.embeddings import EmbeddingService
+from src.rag.utils import hash_chunk_content, validate_metadata
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Vectors per upsert request and concurrent HTTP requests per index handle
+UPSERT_BATCH_SIZE = 100
+PINECONE_POOL_THREADS = 30
+
+# Texts embedded per pipeline step in add_texts; a full round of concurrent embedding batches
+EMBEDDING_CHUNK_SIZE = 800
+
+# Pinecone API limits: results per query and IDs per delete request
+MAX_QUERY_TOP_K = 10000
+DELETE_BATCH_SIZE = 1000
+
+# Index create/delete status polling
+INDEX_POLL_INTERVAL_SECONDS = 0.1
+INDEX_READY_TIMEOUT_SECONDS = 30.0
+
+
+@functools.lru_cache(maxsize=4)
+def _zero_vector(dimension: int) -> List[float]:
+    """Shared all-zero query vector used to enumerate IDs (never mutate the result)"""
+    return [0.0] * dimension
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key: str, pool_threads: int, use_grpc: bool = False) -> Pinecone:
+    """Pinecone client shared by every PineconeStore with the same settings"""
+    if use_grpc:
+        if PineconeGRPC is not None:
+            return PineconeGRPC(api_key=api_key, pool_threads=pool_threads)
+        logger.warning("PINECONE_USE_GRPC is set but pinecone[grpc] is not installed, using REST")
+    return Pinecone(api_key=api_key, pool_threads=pool_threads)
+
+
+def _wait_all(async_results: Iterable[Any]) -> List[Any]:
+    """Block until every async_req call finishes and return their results, re-raising the first failure.
+
+    The REST client returns ApplyResults (.get()); the gRPC client returns futures (.result()).
+    """
+    return [
+        async_result.result() if isinstance(async_result, Future) else async_result.get()
+        for async_result in async_results
+    ]
+
+
+# Index handles keyed by (api_key, index_name, pool_threads, use_grpc), reused across
+# PineconeStore instances so constructing a store per request doesn't re-resolve the index host
+_index_handles: Dict[tuple, Any] = {}
+
 
 class PineconeStore:
     """Pinecone Serverless vector store wrapper for RAG"""
@@ -17,12 +75,17 @@ class PineconeStore:
         self,
         index_name: Optional[str] = None,
         embedding_service: Optional[EmbeddingService] = None,
+        batch_size: int = UPSERT_BATCH_SIZE,
+        pool_threads: int = PINECONE_POOL_THREADS,
     ):
         self.index_name = index_name or settings.pinecone_index_name
         self.api_key = settings.pinecone_api_key
+        self.batch_size = batch_size
+        self.pool_threads = pool_threads
         
-        # Initialize Pinecone client
-        self.pc = Pinecone(api_key=self.api_key)
+        # Initialize Pinecone client (pool_threads sizes the thread pool behind async_req calls)
+        self.use_grpc = settings.pinecone_use_grpc
+        self.pc = _get_client(self.api_key, pool_threads, self.use_grpc)
         
         # Initialize embedding service
         self.embedding_service = embedding_service or EmbeddingService()
@@ -54,12 +117,17 @@ class PineconeStore:
     
     def _get_or_create_index(self):
         """Get existing index or create a new one if it doesn't exist"""
+        handle_key = (self.api_key, self.index_name, self.pool_threads, self.use_grpc)
+        index = _index_handles.get(handle_key)
+        if index is not None:
+            return index
+        
         try:
-            # Check if index exists
-            if self.index_name in [index.name for index in self.pc.list_indexes()]:
+            # Check if index exists (a single describe call rather than listing every index)
+            try:
+                self.pc.describe_index(self.index_name)
                 logger.info("Using existing Pinecone index", index_name=self.index_name)
-                return self.pc.Index(self.index_name)
-            else:
+            except NotFoundException:
                 # Create new index
                 logger.info("Creating new Pinecone index", index_name=self.index_name, dimension=self.dimension)
                 self.pc.create_index(
@@ -71,14 +139,27 @@ class PineconeStore:
                         region="us-east-1"
                     )
                 )
-                # Wait a moment for index to be ready
-                import time
-                time.sleep(2)
-                return self.pc.Index(self.index_name)
+                self._wait_for_index(ready=True)
+            index = self.pc.Index(self.index_name, pool_threads=self.pool_threads)
+            _index_handles[handle_key] = index
+            return index
         except Exception as e:
             logger.error("Error getting or creating Pinecone index", error=str(e))
             raise
     
+    def _wait_for_index(self, ready: bool) -> None:
+        """Poll until the index reports ready (ready=True) or no longer exists (ready=False)"""
+        deadline = time.monotonic() + INDEX_READY_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                if self.pc.describe_index(self.index_name).status["ready"] and ready:
+                    return
+            except NotFoundException:
+                if not ready:
+                    return
+            time.sleep(INDEX_POLL_INTERVAL_SECONDS)
+        logger.warning("Timed out waiting for Pinecone index", index_name=self.index_name, ready=ready)
+    
     def add_texts(
         self,
         texts: List[str],
@@ -94,7 +175,9 @@ class PineconeStore:
         
         Args:
             texts: List of text strings to add
-            metadatas: Optional list of metadata dicts
+            metadatas: Optional list of metadata dicts. With validate_tenant_clone_ids=True
+                add_texts takes ownership of them and may add "text" and "chunk_hash" in place
+                (CloneVectorStore passes private copies); otherwise they are copied first.
             ids: Optional list of vector IDs
             namespace: Optional namespace for isolation (required when validate_tenant_clone_ids=True)
             validate_tenant_clone_ids: If True, validates metadata includes matching tenant_id/clone_id
@@ -107,10 +190,6 @@ class PineconeStore:
         if not texts:
             return []
         
-        # Prepare metadatas
-        if metadatas is None:
-            metadatas = [{} for _ in texts]
-        
         # Validate metadata if requested (used by CloneVectorStore)
         if validate_tenant_clone_ids:
             if not expected_tenant_id or not expected_clone_id:
@@ -123,61 +202,155 @@ class PineconeStore:
                     "Use CloneVectorStore to automatically provide namespace and validation."
                 )
             
-            from src.rag.utils import validate_metadata
-            from uuid import UUID
-            
-            validated_metadatas = []
-            for i, metadata in enumerate(metadatas):
-                validated_metadata = validate_metadata(
-                    metadata,
-                    UUID(expected_tenant_id),
-                    UUID(expected_clone_id),
-                    metadata_index=i,
-                )
-                validated_metadatas.append(validated_metadata)
-            metadatas = validated_metadatas
+            # Parse (and canonicalize) the expected IDs once for the whole batch
+            tenant_id_str = str(uuid.UUID(expected_tenant_id))
+            clone_id_str = str(uuid.UUID(expected_clone_id))
+            metadatas = [
+                validate_metadata(metadata, tenant_id_str, clone_id_str, metadata_index=i)
+                for i, metadata in enumerate(metadatas or [{} for _ in texts])
+            ]
         
-        # Generate embeddings
-        logger.info("Generating embeddings", text_count=len(texts))
-        embeddings = self.embedding_service.embed_texts(texts)
+        # Attach the text to each vector's metadata (Pinecone supports storing it as a string),
+        # along with its chunk hash so retrieval doesn't have to re-hash the text for RL boosts.
+        # Validated metadatas are owned by this call (see Args), so they're updated in place;
+        # unvalidated ones are the caller's and are copied once so its dicts aren't modified.
+        if metadatas is None:
+            metadatas = [{} for _ in texts]
+        elif not validate_tenant_clone_ids:
+            metadatas = [dict(metadata) for metadata in metadatas]
+        for metadata, text in zip(metadatas, texts):
+            metadata["text"] = text
+            metadata["chunk_hash"] = hash_chunk_content(text)
         
         # Generate IDs if not provided
         if ids is None:
-            ids = [str(uuid.uuid4()) for _ in texts]
-        
-        # Prepare vectors for Pinecone (text field + metadata)
-        vectors = []
-        for i, (text, embedding, metadata, vector_id) in enumerate(zip(texts, embeddings, metadatas, ids)):
-            # Pinecone metadata can't contain the text directly, so we store it separately
-            # The text will be stored in metadata as a string (Pinecone supports this)
-            vector_metadata = {**metadata, "text": text}
-            vectors.append({
-                "id": vector_id,
-                "values": embedding,
-                "metadata": vector_metadata,
-            })
+            ids = [uuid.uuid4().hex for _ in texts]
         
         # Upsert to Pinecone with namespace
         # IMPORTANT: When used through CloneVectorStore, namespace is ALWAYS provided and required.
         # The namespace parameter is optional here only for backward compatibility or direct use.
         # For clone-scoped operations, always use CloneVectorStore which ensures namespace is set.
+        upsert_kwargs = {}
+        if namespace:
+            upsert_kwargs["namespace"] = namespace
+        else:
+            # Warn if namespace is not provided (should use CloneVectorStore for clone-scoped operations)
+            logger.warning(
+                "Adding texts without namespace. For clone-scoped operations, use CloneVectorStore "
+                "which automatically provides the correct namespace."
+            )
+        
+        logger.info("Generating embeddings", text_count=len(texts))
         try:
-            upsert_kwargs = {"vectors": vectors}
-            if namespace:
-                upsert_kwargs["namespace"] = namespace
-            else:
-                # Warn if namespace is not provided (should use CloneVectorStore for clone-scoped operations)
-                logger.warning(
-                    "Adding texts without namespace. For clone-scoped operations, use CloneVectorStore "
-                    "which automatically provides the correct namespace."
+            # Pipeline embedding and upserting: each chunk's upserts run on the index's thread
+            # pool while the next chunk is being embedded
+            async_results = []
+            for chunk_start in range(0, len(texts), EMBEDDING_CHUNK_SIZE):
+                chunk_end = chunk_start + EMBEDDING_CHUNK_SIZE
+                chunk_texts = texts[chunk_start:chunk_end]
+                embeddings = self.embedding_service.embed_texts(chunk_texts)
+                
+                vectors = [
+                    {"id": vector_id, "values": embedding, "metadata": metadata}
+                    for embedding, metadata, vector_id in zip(
+                        embeddings, metadatas[chunk_start:chunk_end], ids[chunk_start:chunk_end]
+                    )
+                ]
+                async_results.extend(
+                    self.index.upsert(vectors=vectors[start:start + self.batch_size], async_req=True, **upsert_kwargs)
+                    for start in range(0, len(vectors), self.batch_size)
                 )
-            self.index.upsert(**upsert_kwargs)
-            logger.info("Texts added to Pinecone", count=len(texts), namespace=namespace)
+            
+            # Wait for all in-flight batches so a failed upsert surfaces here
+            _wait_all(async_results)
+            logger.info(
+                "Texts added to Pinecone",
+                count=len(texts),
+                batches=len(async_results),
+                namespace=namespace,
+            )
             return ids
         except Exception as e:
             logger.error("Error adding texts to Pinecone", error=str(e))
             raise
     
+    def _validate_search_filter(
+        self,
+        filter_metadata: Optional[Dict],
+        namespace: Optional[str],
+        validate_tenant_clone_ids: bool,
+        expected_tenant_id: Optional[str],
+        expected_clone_id: Optional[str],
+    ) -> None:
+        """Validate search arguments when tenant/clone validation is requested (used by CloneVectorStore)"""
+        if not validate_tenant_clone_ids:
+            return
+        if not expected_tenant_id or not expected_clone_id:
+            raise ValueError(
+                "expected_tenant_id and expected_clone_id are required when validate_tenant_clone_ids=True"
+            )
+        if not namespace:
+            raise ValueError(
+                "namespace is required when validate_tenant_clone_ids=True. "
+                "Use CloneVectorStore to automatically provide namespace and validation."
+            )
+        
+        if filter_metadata:
+            # Validate that filter_metadata matches expected IDs
+            validate_metadata(
+                filter_metadata,
+                uuid.UUID(expected_tenant_id),
+                uuid.UUID(expected_clone_id),
+            )
+    
+    def _query_kwargs(
+        self,
+        n_results: int,
+        filter_metadata: Optional[Dict],
+        namespace: Optional[str],
+        include_metadata: bool = True,
+    ) -> Dict:
+        """Build the index.query arguments shared by every query vector in a search"""
+        # IMPORTANT: When used through CloneVectorStore, namespace is ALWAYS provided and required.
+        # The namespace parameter is optional here only for backward compatibility or direct use.
+        # For clone-scoped operations, always use CloneVectorStore which ensures namespace is set.
+        query_kwargs = {
+            "top_k": n_results,
+            "include_metadata": include_metadata,
+            "include_values": False,
+        }
+        if namespace:
+            query_kwargs["namespace"] = namespace
+        else:
+            # Warn if namespace is not provided (should use CloneVectorStore for clone-scoped operations)
+            logger.warning(
+                "Searching without namespace. For clone-scoped operations, use CloneVectorStore "
+                "which automatically provides the correct namespace."
+            )
+        if filter_metadata:
+            query_kwargs["filter"] = {key: {"$eq": value} for key, value in filter_metadata.items()}
+        return query_kwargs
+    
+    @staticmethod
+    def _format_matches(
+        results,
+        include_text: bool = True,
+        metadata_fields: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """Convert a Pinecone query response into result dicts"""
+        return [
+            {
+                "text": match.metadata.get("text", "") if include_text and match.metadata else "",
+                "metadata": {
+                    k: v for k, v in (match.metadata or {}).items()
+                    if k != "text" and (metadata_fields is None or k in metadata_fields)
+                },
+                "id": match.id,
+                "distance": 1 - match.score if match.score else None,  # Convert similarity to distance
+            }
+            for match in results.matches or ()
+        ]
+    
     def search(
         self,
         query: str,
@@ -187,6 +360,8 @@ class PineconeStore:
         validate_tenant_clone_ids: bool = False,
         expected_tenant_id: Optional[str] = None,
         expected_clone_id: Optional[str] = None,
+        include_text: bool = True,
+        metadata_fields: Optional[List[str]] = None,
     ) -> List[Dict]:
         """
         Search for similar texts.
@@ -199,75 +374,32 @@ class PineconeStore:
             validate_tenant_clone_ids: If True, validates filter_metadata includes matching tenant_id/clone_id
             expected_tenant_id: Expected tenant_id for validation (required if validate_tenant_clone_ids=True)
             expected_clone_id: Expected clone_id for validation (required if validate_tenant_clone_ids=True)
+            include_text: If False, results have empty text; with no metadata_fields either, metadata
+                isn't fetched at all (ID + distance only, e.g. for re-ranking stages)
+            metadata_fields: Optional allow-list of metadata keys to keep in results
         
         Returns:
             List of search results
         """
-        # Validate filter_metadata if requested (used by CloneVectorStore)
-        if validate_tenant_clone_ids:
-            if not expected_tenant_id or not expected_clone_id:
-                raise ValueError(
-                    "expected_tenant_id and expected_clone_id are required when validate_tenant_clone_ids=True"
-                )
-            if not namespace:
-                raise ValueError(
-                    "namespace is required when validate_tenant_clone_ids=True. "
-                    "Use CloneVectorStore to automatically provide namespace and validation."
-                )
-            
-            if filter_metadata:
-                from src.rag.utils import validate_metadata
-                from uuid import UUID
-                # Validate that filter_metadata matches expected IDs
-                validate_metadata(
-                    filter_metadata,
-                    UUID(expected_tenant_id),
-                    UUID(expected_clone_id),
-                )
+        self._validate_search_filter(
+            filter_metadata, namespace, validate_tenant_clone_ids, expected_tenant_id, expected_clone_id
+        )
         
         # Generate query embedding
         query_embedding = self.embedding_service.embed_text(query)
         
-        # Build filter if provided
-        filter_dict = None
-        if filter_metadata:
-            filter_dict = {}
-            for key, value in filter_metadata.items():
-                filter_dict[key] = {"$eq": value}
-        
         try:
             # Query Pinecone with namespace
-            # IMPORTANT: When used through CloneVectorStore, namespace is ALWAYS provided and required.
-            # The namespace parameter is optional here only for backward compatibility or direct use.
-            # For clone-scoped operations, always use CloneVectorStore which ensures namespace is set.
-            query_kwargs = {
-                "vector": query_embedding,
-                "top_k": n_results,
-                "include_metadata": True,
-            }
-            if namespace:
-                query_kwargs["namespace"] = namespace
-            else:
-                # Warn if namespace is not provided (should use CloneVectorStore for clone-scoped operations)
-                logger.warning(
-                    "Searching without namespace. For clone-scoped operations, use CloneVectorStore "
-                    "which automatically provides the correct namespace."
-                )
-            if filter_dict:
-                query_kwargs["filter"] = filter_dict
-            
-            results = self.index.query(**query_kwargs)
-            
-            # Format results
-            formatted_results = []
-            if results.matches:
-                for match in results.matches:
-                    formatted_results.append({
-                        "text": match.metadata.get("text", "") if match.metadata else "",
-                        "metadata": {k: v for k, v in (match.metadata or {}).items() if k != "text"},
-                        "id": match.id,
-                        "distance": 1 - match.score if match.score else None,  # Convert similarity to distance
-                    })
+            results = self.index.query(
+                vector=query_embedding,
+                **self._query_kwargs(
+                    n_results,
+                    filter_metadata,
+                    namespace,
+                    include_metadata=include_text or bool(metadata_fields),
+                ),
+            )
+            formatted_results = self._format_matches(results, include_text, metadata_fields)
             
             logger.debug("Search completed", query_preview=query[:50], results_count=len(formatted_results), namespace=namespace)
             return formatted_results
@@ -275,6 +407,53 @@ class PineconeStore:
             logger.error("Error searching Pinecone", error=str(e))
             raise
     
+    def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 5,
+        filter_metadata: Optional[Dict] = None,
+        namespace: Optional[str] = None,
+        validate_tenant_clone_ids: bool = False,
+        expected_tenant_id: Optional[str] = None,
+        expected_clone_id: Optional[str] = None,
+    ) -> List[List[Dict]]:
+        """
+        Search for several queries at once: one embedding request, concurrent Pinecone queries.
+        
+        Args:
+            queries: Search query strings
+            n_results: Number of results to return per query
+            filter_metadata: Optional metadata filters (applied to every query)
+            namespace: Optional namespace for isolation (required when validate_tenant_clone_ids=True)
+            validate_tenant_clone_ids: If True, validates filter_metadata includes matching tenant_id/clone_id
+            expected_tenant_id: Expected tenant_id for validation (required if validate_tenant_clone_ids=True)
+            expected_clone_id: Expected clone_id for validation (required if validate_tenant_clone_ids=True)
+        
+        Returns:
+            One list of search results per query, in query order
+        """
+        self._validate_search_filter(
+            filter_metadata, namespace, validate_tenant_clone_ids, expected_tenant_id, expected_clone_id
+        )
+        if not queries:
+            return []
+        
+        query_embeddings = self.embedding_service.embed_texts(queries)
+        
+        try:
+            query_kwargs = self._query_kwargs(n_results, filter_metadata, namespace)
+            responses = _wait_all([
+                self.index.query(vector=query_embedding, async_req=True, **query_kwargs)
+                for query_embedding in query_embeddings
+            ])
+            formatted_results = [self._format_matches(results) for results in responses]
+            
+            logger.debug("Batch search completed", query_count=len(queries), namespace=namespace)
+            return formatted_results
+        except Exception as e:
+            logger.error("Error searching Pinecone", error=str(e))
+            raise
+    
     def delete(
         self,
         ids: Optional[List[str]] = None,
@@ -312,13 +491,11 @@ class PineconeStore:
                     )
                 
                 if filter_metadata:
-                    from src.rag.utils import validate_metadata
-                    from uuid import UUID
                     # Validate that filter_metadata matches expected IDs
                     validate_metadata(
                         filter_metadata,
-                        UUID(expected_tenant_id),
-                        UUID(expected_clone_id),
+                        uuid.UUID(expected_tenant_id),
+                        uuid.UUID(expected_clone_id),
                     )
             
             # WARNING: Delete without namespace affects global index (all namespaces)
@@ -340,39 +517,20 @@ class PineconeStore:
                 logger.info("Texts deleted from Pinecone", ids_count=len(ids), namespace=namespace)
                 return True
             elif filter_metadata:
-                # Pinecone doesn't support delete by filter directly
-                # We need to query first, then delete by IDs
-                # Query to get IDs matching the filter
-                from src.rag.embeddings import EmbeddingService
-                embedding_service = EmbeddingService()
-                # Use a dummy query to get all matching vectors
-                dummy_embedding = [0.0] * embedding_service.get_embedding_dimension()
-                
-                filter_dict = {}
-                for key, value in filter_metadata.items():
-                    filter_dict[key] = {"$eq": value}
-                
-                query_kwargs = {
-                    "vector": dummy_embedding,
-                    "top_k": 10000,  # Maximum reasonable limit
-                    "include_metadata": False,
-                    "filter": filter_dict,
-                }
-                if namespace:
-                    query_kwargs["namespace"] = namespace
-                
-                # Query with a very high top_k to get all matching vectors
-                results = self.index.query(**query_kwargs)
-                
-                if results.matches:
-                    ids_to_delete = [match.id for match in results.matches]
-                    delete_kwargs["ids"] = ids_to_delete
-                    self.index.delete(**delete_kwargs)
-                    logger.info("Texts deleted from Pinecone by filter", ids_count=len(ids_to_delete), namespace=namespace)
-                    return True
-                else:
-                    logger.info("No vectors found matching filter criteria", namespace=namespace)
+                filter_dict = {key: {"$eq": value} for key, value in filter_metadata.items()}
+                try:
+                    # Single server-side delete; no IDs cross the wire
+                    self.index.delete(filter=filter_dict, **delete_kwargs)
+                    logger.info("Texts deleted from Pinecone by filter", namespace=namespace)
                     return True
+                except PineconeApiException as e:
+                    # Indexes without delete-by-metadata support reject the request
+                    logger.info(
+                        "Delete by filter not supported, deleting matching IDs instead",
+                        namespace=namespace,
+                        error=str(e),
+                    )
+                return self._delete_by_query(filter_dict, delete_kwargs)
             else:
                 raise ValueError(
                     "Either 'ids' or 'filter_metadata' must be provided."
@@ -381,6 +539,32 @@ class PineconeStore:
             logger.error("Error deleting from Pinecone", error=str(e))
             return False
     
+    def _delete_by_query(self, filter_dict: Dict, delete_kwargs: Dict) -> bool:
+        """Delete vectors matching filter_dict by querying for their IDs first"""
+        namespace = delete_kwargs.get("namespace")
+        query_kwargs = {
+            "vector": _zero_vector(self.dimension),
+            "top_k": MAX_QUERY_TOP_K,
+            "include_metadata": False,
+            "filter": filter_dict,
+            **delete_kwargs,
+        }
+        results = self.index.query(**query_kwargs)
+        
+        if not results.matches:
+            logger.info("No vectors found matching filter criteria", namespace=namespace)
+            return True
+        
+        ids_to_delete = [match.id for match in results.matches]
+        # Pinecone caps IDs per delete request; send the chunks concurrently
+        async_results = [
+            self.index.delete(ids=ids_to_delete[start:start + DELETE_BATCH_SIZE], async_req=True, **delete_kwargs)
+            for start in range(0, len(ids_to_delete), DELETE_BATCH_SIZE)
+        ]
+        _wait_all(async_results)
+        logger.info("Texts deleted from Pinecone by filter", ids_count=len(ids_to_delete), namespace=namespace)
+        return True
+    
     def get_collection_count(self) -> int:
         """Get the number of vectors in the index"""
         try:
@@ -419,9 +603,8 @@ class PineconeStore:
                 environment="development"
             )
             self.pc.delete_index(self.index_name)
-            # Wait a moment
-            import time
-            time.sleep(2)
+            _index_handles.pop((self.api_key, self.index_name, self.pool_threads, self.use_grpc), None)
+            self._wait_for_index(ready=False)
             # Recreate
             self.index = self._get_or_create_index()
             logger.info("Pinecone index reset", index_name=self.index_name)
@@ -6,6 +6,11 @@ This module handles context retrieval for clone responses. It supports:
 - Re-ranking based on learned chunk quality scores
 """
 
+import asyncio
+import heapq
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from src.rag.vector_store import VectorStore
 from src.rag.clone_vector_store import CloneVectorStore
@@ -14,6 +19,67 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Separator between formatted chunks in the context string
+CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+# Raw search results are reused for repeated queries within this window. Writes through
+# CloneVectorStore invalidate their namespace; writes from another process may take up to
+# this long to show up for a repeated query.
+SEARCH_CACHE_TTL_SECONDS = 60
+SEARCH_CACHE_SIZE = 1024
+
+
+class _SearchCache:
+    """Process-wide TTL LRU of vector store search results, keyed by namespace and query"""
+
+    def __init__(self, maxsize: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers annotate and re-sort results, so hand out fresh dicts
+        return [dict(result) for result in results]
+
+    def set(self, key: tuple, results: List[Dict]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, tuple(dict(result) for result in results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+
+
+_search_cache = _SearchCache()
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query for cache lookups.
+
+    Queries differing only in case, whitespace or trailing punctuation
+    ("What's new?" vs "what's new") retrieve the same chunks.
+    """
+    return " ".join(query.casefold().split()).rstrip("?!. ")
+
+
+def invalidate_search_cache(namespace: str) -> None:
+    """Drop cached search results for a namespace after its vectors change"""
+    _search_cache.invalidate_namespace(namespace)
+
 
 class RAGRetriever:
     """RAG retriever for context retrieval with optional RL-based boosting.
@@ -59,7 +125,7 @@ class RAGRetriever:
         """Apply learned score boosts to retrieval results.
 
         For each result:
-        1. Compute chunk hash (using shared hash_chunk_content function)
+        1. Read the chunk hash stored at ingest, or compute it (using shared hash_chunk_content function)
         2. Look up learned score
         3. Add boost to base similarity score (using shared compute_score_boost)
         4. Track boost for logging/debugging
@@ -77,7 +143,8 @@ class RAGRetriever:
                 result["boost_applied"] = 0.0
                 continue
 
-            chunk_hash = hash_chunk_content(text)
+            # Hash stored at ingest; older vectors without one are hashed here
+            chunk_hash = result.get("metadata", {}).get("chunk_hash") or hash_chunk_content(text)
             base_score = 1.0 - result.get("distance", 0.5)  # Convert distance to similarity
 
             # Look up learned score and compute boost using shared function
@@ -122,22 +189,101 @@ class RAGRetriever:
             has_chunk_scores=bool(self.chunk_scores)
         )
 
-        # Search vector store
-        results = self.vector_store.search(
-            query=query,
-            n_results=fetch_k,
-            filter_metadata=filter_metadata,
+        # Search vector store. Clone-scoped stores are cached by namespace, so repeat
+        # lookups within the TTL skip the embedding + Pinecone round trip.
+        cache_key = self._search_cache_key(query, fetch_k, filter_metadata)
+        results = _search_cache.get(cache_key) if cache_key else None
+        if results is None:
+            results = self.vector_store.search(
+                query=query,
+                n_results=fetch_k,
+                filter_metadata=filter_metadata,
+            )
+            if cache_key:
+                _search_cache.set(cache_key, results)
+        
+        return self._rank_and_filter(results, k)
+    
+    def retrieve_many(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filter_metadata: Optional[Dict] = None,
+    ) -> List[List[Dict]]:
+        """Retrieve context for several queries (e.g. query rewrites) in one batch.
+
+        Uncached queries are embedded in a single request and searched concurrently,
+        instead of one embed + query round trip per query.
+
+        Args:
+            queries: The queries to retrieve for
+            top_k: Number of results to return per query (default: self.top_k)
+            filter_metadata: Optional metadata filters (applied to every query)
+
+        Returns:
+            One list of relevant chunks per query, in query order
+        """
+        k = top_k or self.top_k
+        fetch_k = k * 2 if self.chunk_scores else k
+
+        logger.info("Retrieving context for queries", query_count=len(queries), top_k=k, fetch_k=fetch_k)
+
+        cache_keys = [self._search_cache_key(query, fetch_k, filter_metadata) for query in queries]
+        all_results = [_search_cache.get(key) if key else None for key in cache_keys]
+        missing = [i for i, results in enumerate(all_results) if results is None]
+        if missing:
+            searched = self.vector_store.search_batch(
+                [queries[i] for i in missing],
+                n_results=fetch_k,
+                filter_metadata=filter_metadata,
+            )
+            for i, results in zip(missing, searched):
+                all_results[i] = results
+                if cache_keys[i]:
+                    _search_cache.set(cache_keys[i], results)
+
+        return [self._rank_and_filter(results, k) for results in all_results]
+
+    async def aretrieve(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        filter_metadata: Optional[Dict] = None,
+    ) -> List[Dict]:
+        """Async retrieve: runs the blocking embed + Pinecone round trip in a worker thread
+        so the event loop keeps serving other requests meanwhile"""
+        return await asyncio.to_thread(self.retrieve, query, top_k, filter_metadata)
+
+    async def aretrieve_many(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filter_metadata: Optional[Dict] = None,
+    ) -> List[List[Dict]]:
+        """Async retrieve_many (see aretrieve)"""
+        return await asyncio.to_thread(self.retrieve_many, queries, top_k, filter_metadata)
+
+    def _search_cache_key(self, query: str, fetch_k: int, filter_metadata: Optional[Dict]) -> Optional[tuple]:
+        """Search cache key, or None when the store isn't clone-scoped (no namespace)"""
+        namespace = getattr(self.vector_store, "namespace", None)
+        if not namespace:
+            return None
+        return (
+            namespace,
+            normalize_query(query),
+            fetch_k,
+            repr(sorted(filter_metadata.items())) if filter_metadata else None,
         )
 
+    def _rank_and_filter(self, results: List[Dict], k: int) -> List[Dict]:
+        """Apply RL boosts and re-rank (when chunk scores are set), then drop low-similarity results"""
         # Apply RL score boosts if we have chunk scores
         if self.chunk_scores and results:
             results = self._apply_score_boosts(results)
 
-            # Re-rank by adjusted score (descending)
-            results.sort(key=lambda x: x.get("adjusted_score", 0), reverse=True)
-
-            # Take top_k after re-ranking
-            results = results[:k]
+            # Re-rank by adjusted score (descending) and take top_k; a partial selection
+            # (O(n log k)) with the same ordering and tie-breaking as sort + slice
+            results = heapq.nlargest(k, results, key=lambda x: x.get("adjusted_score", 0))
 
             # Log boost impact
             boosts_applied = [r.get("boost_applied", 0) for r in results if r.get("boost_applied", 0) != 0]
@@ -151,9 +297,10 @@ class RAGRetriever:
         # Filter by minimum score (distance threshold)
         # ChromaDB uses cosine distance, lower is better
         # We'll treat distance < 0.5 as good matches (adjustable)
+        max_distance = 1.0 - self.min_score
         filtered_results = [
             r for r in results
-            if r.get("distance") is None or r["distance"] < (1.0 - self.min_score)
+            if (distance := r.get("distance")) is None or distance < max_distance
         ]
 
         logger.info(
@@ -164,21 +311,22 @@ class RAGRetriever:
 
         return filtered_results
     
+    @staticmethod
+    def format_chunk(result: Dict) -> str:
+        """Format a single retrieved result for inclusion in the context string"""
+        text = result.get("text", "")
+        metadata = result.get("metadata", {})
+        
+        # Add source information if available
+        source = metadata.get("source", "Unknown")
+        return f"[Source: {source}]\n{text}"
+    
     def format_context(self, results: List[Dict]) -> str:
         """Format retrieved results into context string"""
         if not results:
             return ""
         
-        context_parts = []
-        for i, result in enumerate(results, 1):
-            text = result.get("text", "")
-            metadata = result.get("metadata", {})
-            
-            # Add source information if available
-            source = metadata.get("source", "Unknown")
-            context_parts.append(f"[Source: {source}]\n{text}")
-        
-        return "\n\n---\n\n".join(context_parts)
+        return CONTEXT_SEPARATOR.join(self.format_chunk(result) for result in results)
     
     def retrieve_and_format(
         self,
@@ -1,7 +1,7 @@
 """Utility functions for RAG operations"""
 
 import hashlib
-from typing import Dict
+from typing import Dict, Union
 from uuid import UUID
 from src.utils.logging import get_logger
 
@@ -57,8 +57,8 @@ def compute_score_boost(learned_score: float) -> float:
 
 def validate_metadata(
     metadata: Dict,
-    tenant_id: UUID,
-    clone_id: UUID,
+    tenant_id: Union[UUID, str],
+    clone_id: Union[UUID, str],
     metadata_index: int = None,
 ) -> Dict:
     """
@@ -67,21 +67,25 @@ def validate_metadata(
     
     Args:
         metadata: Metadata dictionary to validate
-        tenant_id: Expected tenant_id
-        clone_id: Expected clone_id
+        tenant_id: Expected tenant_id (a UUID, or its canonical string form to skip
+            formatting it on every call in bulk loops)
+        clone_id: Expected clone_id (a UUID or its canonical string form)
         metadata_index: Optional index for error messages (when validating a list)
     
     Returns:
-        Validated metadata dictionary with tenant_id and clone_id ensured
+        Validated metadata dictionary with tenant_id and clone_id ensured. This is the
+        input dict itself when it already has both IDs as strings, otherwise a new dict.
     
     Raises:
         ValueError: If tenant_id or clone_id don't match expected values
     """
-    metadata = metadata.copy() if metadata else {}
+    tenant_id_str = str(tenant_id)
+    clone_id_str = str(clone_id)
+    metadata = metadata or {}
     
     # Check if metadata contains tenant_id and validate it matches
     if "tenant_id" in metadata:
-        if str(metadata["tenant_id"]) != str(tenant_id):
+        if str(metadata["tenant_id"]) != tenant_id_str:
             index_msg = f" at index {metadata_index}" if metadata_index is not None else ""
             raise ValueError(
                 f"Metadata{index_msg} tenant_id ({metadata['tenant_id']}) does not match "
@@ -90,15 +94,16 @@ def validate_metadata(
     
     # Check if metadata contains clone_id and validate it matches
     if "clone_id" in metadata:
-        if str(metadata["clone_id"]) != str(clone_id):
+        if str(metadata["clone_id"]) != clone_id_str:
             index_msg = f" at index {metadata_index}" if metadata_index is not None else ""
             raise ValueError(
                 f"Metadata{index_msg} clone_id ({metadata['clone_id']}) does not match "
                 f"expected clone_id ({clone_id})"
             )
     
-    # Ensure tenant_id and clone_id are in metadata (for reference/auditing)
-    metadata["tenant_id"] = str(tenant_id)
-    metadata["clone_id"] = str(clone_id)
+    # Already carries both IDs as strings: nothing to change, so skip the copy
+    if metadata.get("tenant_id") == tenant_id_str and metadata.get("clone_id") == clone_id_str:
+        return metadata
     
-    return metadata
+    # Ensure tenant_id and clone_id are in metadata (for reference/auditing)
+    return {**metadata, "tenant_id": tenant_id_str, "clone_id": clone_id_str}
@@ -40,6 +40,15 @@ class VectorStore:
         """Search for similar texts"""
         return self.pinecone_store.search(query, n_results, filter_metadata)
     
+    def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 5,
+        filter_metadata: Optional[Dict] = None,
+    ) -> List[List[Dict]]:
+        """Search for several queries with a single embedding request"""
+        return self.pinecone_store.search_batch(queries, n_results, filter_metadata)
+    
     def delete(self, ids: Optional[List[str]] = None, where: Optional[Dict] = None) -> bool:
         """Delete texts from vector store"""
         # Convert 'where' to filter_metadata for Pinecone
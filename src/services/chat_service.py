@@ -10,23 +10,32 @@ This service handles the core chat functionality including:
 See docs/RL_OVERVIEW.md for documentation on the reinforcement learning system.
 """
 
+import asyncio
 import time
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, func, update
 
+from src.database.db import get_db_session
 from src.database.models import Session as ChatSession, Message, Clone
 from src.rag.retriever import RAGRetriever
-from src.rag.clone_vector_store import CloneVectorStore
-from src.llm.client import LLMClient
-from src.llm.prompt_service import PromptService
+from src.rag.clone_vector_store import get_clone_vector_store
+from src.llm.client import LLMClient, get_llm_client
+from src.llm.prompt_service import PromptService, MAX_HISTORY_MESSAGES
+from src.rag.utils import hash_chunk_content
 from src.services.chunk_score_service import ChunkScoreService
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Futures for async sends still being answered, keyed by (clone_id, session_id, message,
+# external_user_name); resolve to the stored (user_message_id, clone_message_id)
+_in_flight_messages: Dict[tuple, "asyncio.Future[Tuple[UUID, UUID]]"] = {}
+
+# Metadata keys not copied into a message's stored RAG context (chunk_hash is stored per chunk)
+STORED_METADATA_EXCLUDED = frozenset({"tenant_id", "clone_id", "chunk_hash"})
+
 
 class ChatService:
     """Service for managing chat conversations with RL-based learning."""
@@ -47,18 +56,15 @@ class ChatService:
         if rag_retriever:
             self.rag_retriever = rag_retriever
         else:
-            clone_vector_store = CloneVectorStore(
-                clone_id=clone_id,
-                tenant_id=tenant_id,
-            )
+            clone_vector_store = get_clone_vector_store(clone_id, tenant_id)
             self.rag_retriever = RAGRetriever(
                 clone_vector_store=clone_vector_store,
                 top_k=5,
                 min_score=0.5,
             )
 
-        # Initialize LLM client
-        self.llm_client = llm_client or LLMClient()
+        # Initialize LLM client (shared across requests, so connections are reused)
+        self.llm_client = llm_client or get_llm_client()
 
         # Initialize prompt service
         self.prompt_service = PromptService(llm_client=self.llm_client)
@@ -107,24 +113,24 @@ class ChatService:
         Used when owner clicks "New Conversation" button.
         """
         if close_existing:
-            # Close all active sessions for this clone owner
-            active_sessions = (
-                self.db.query(ChatSession)
-                .filter(
+            # Close all active sessions for this clone owner with a single UPDATE
+            # (no session rows are loaded into the ORM)
+            closed_ids = self.db.execute(
+                update(ChatSession)
+                .where(
                     ChatSession.clone_id == self.clone_id,
                     ChatSession.external_platform == 'web',
                     ChatSession.status == 'active',
                 )
-                .all()
-            )
-
-            for session in active_sessions:
-                session.status = 'closed'
+                .values(status='closed')
+                .returning(ChatSession.id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
 
             self.db.commit()
             logger.info(
                 "Closed existing owner sessions",
-                count=len(active_sessions),
+                count=len(closed_ids),
                 clone_id=str(self.clone_id)
             )
 
@@ -156,82 +162,60 @@ class ChatService:
 
         return messages
 
-    def send_message_and_get_response(
-        self,
-        session_id: int,
-        user_message: str,
-        external_user_name: Optional[str] = None,
-    ) -> Tuple[Message, Message]:
-        """
-        Send a user message and generate clone response with RAG.
-        Returns tuple of (user_message, clone_message).
+    def get_recent_messages(self, session_id: int, limit: int = MAX_HISTORY_MESSAGES) -> List[Tuple[str, str]]:
+        """Get the last `limit` messages for a session as (role, content) rows, oldest first.
+
+        The LLM prompt only reads role and content, so only those columns are loaded
+        (rows still allow .role/.content access); use get_session_messages for full messages.
         """
-        start_time = time.time()
+        messages = (
+            self.db.query(Message.role, Message.content)
+            .filter(
+                Message.session_id == session_id,
+                Message.clone_id == self.clone_id,
+            )
+            .order_by(Message.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        messages.reverse()
+
+        return messages
 
-        # Get session
-        session = self.db.query(ChatSession).filter(ChatSession.id == session_id).first()
+    def _prepare_session(self, session_id: int) -> ChatSession:
+        """Load and validate the session a message is sent to, and load chunk scores for retrieval"""
+        # Get session, loading its clone (for the prompt) in the same query
+        session = (
+            self.db.query(ChatSession)
+            .options(joinedload(ChatSession.clone))
+            .filter(ChatSession.id == session_id)
+            .first()
+        )
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
         if session.clone_id != self.clone_id:
             raise ValueError(f"Session {session_id} does not belong to clone {self.clone_id}")
 
-        # Create user message
-        user_msg = Message(
-            clone_id=self.clone_id,
-            session_id=session_id,
-            role='external_user',
-            content=user_message,
-            external_user_name=external_user_name or 'Owner',
-        )
-        self.db.add(user_msg)
-        self.db.flush()  # Get ID without committing
-
-        logger.info(
-            "User message created",
-            session_id=session_id,
-            message_id=str(user_msg.id),
-            preview=user_message[:50]
-        )
-
         # Load learned chunk scores for RL-based retrieval boosting
-        # TODO: Cache chunk scores in Redis to avoid loading all scores from DB on every message.
-        # Current approach loads ALL scores for clone on each message, which is O(n) where n = scored chunks.
-        # For clones with 10,000+ scored chunks, this becomes a performance bottleneck.
-        # Options: Redis cache with TTL, or session-level cache invalidated on feedback.
+        # (cached per clone and invalidated on feedback, so most messages skip the DB)
         chunk_scores = self.chunk_score_service.get_score_map(self.clone_id)
         self.rag_retriever.set_chunk_scores(chunk_scores)
 
-        # Retrieve RAG context (with RL boosting if scores exist)
-        logger.info("Retrieving RAG context", query_preview=user_message[:50])
-        rag_results = self.rag_retriever.retrieve(
-            query=user_message,
-            top_k=5,
-        )
+        return session
 
+    def _build_llm_messages(
+        self,
+        user_message: str,
+        rag_results: List[Dict],
+        conversation_history: List[Tuple[str, str]],
+        clone: Optional[Clone],
+    ) -> List[Dict[str, str]]:
+        """Build the LLM prompt from the retrieved context, recent history and clone info"""
         # Format RAG context for LLM
         rag_context_str = self.rag_retriever.format_context(rag_results)
 
-        # Build RAG context JSON for storage
-        rag_context_json = {
-            "chunks": [
-                {
-                    "content": result.get("text", ""),
-                    "score": 1.0 - result.get("distance", 0.5),  # Convert distance to similarity score
-                    "metadata": result.get("metadata", {}),
-                }
-                for result in rag_results
-            ]
-        }
-
-        logger.info("RAG context retrieved", chunks_count=len(rag_results))
-
-        # Get conversation history for context
-        conversation_history = self.get_session_messages(session_id)
-
-        # Build messages for LLM
         # Get clone info for personality
-        clone = self.db.query(Clone).filter(Clone.id == self.clone_id).first()
         clone_name = (
             f"{clone.first_name} {clone.last_name}".strip()
             if clone and clone.first_name
@@ -239,31 +223,67 @@ class ChatService:
         )
 
         # TODO: Add style instructions to the prompt service
-        llm_messages = self.prompt_service.build_messages(
+        return self.prompt_service.build_messages(
             current_message=user_message,
             rag_context=rag_context_str,
             conversation_history=conversation_history,
             clone_name=clone_name,
         )
 
-        # Generate clone response
-        logger.info("Generating clone response")
-        llm_response = self.llm_client.generate(
-            messages=llm_messages,
-            temperature=0.7,
-        )
-
-        clone_response_text = llm_response.choices[0].message.content
+    @staticmethod
+    def _build_rag_context_json(rag_results: List[Dict]) -> Dict:
+        """Build the RAG context stored with a clone message (shown as sources, used for feedback).
 
-        # Get token usage
-        usage_stats = self.llm_client.get_usage_stats(llm_response)
-        tokens_used = usage_stats.get("total_tokens", 0)
+        Each chunk keeps its content (displayed in the UI) and its hash, so feedback updates
+        chunk scores without re-hashing. tenant_id/clone_id are dropped from the stored
+        metadata: the message row already records which clone it belongs to.
+        """
+        chunks = []
+        for result in rag_results:
+            text = result.get("text", "")
+            metadata = result.get("metadata", {})
+            chunks.append({
+                "content": text,
+                "score": 1.0 - result.get("distance", 0.5),  # Convert distance to similarity score
+                "chunk_hash": metadata.get("chunk_hash") or hash_chunk_content(text),
+                "metadata": {key: value for key, value in metadata.items() if key not in STORED_METADATA_EXCLUDED},
+            })
+        return {"chunks": chunks}
+
+    def _save_exchange(
+        self,
+        session_id: int,
+        user_msg_id: UUID,
+        clone_msg_id: UUID,
+        user_message: str,
+        external_user_name: Optional[str],
+        rag_results: List[Dict],
+        clone_response_text: str,
+        tokens_used: int,
+        start_time: float,
+        db: Optional[Session] = None,
+    ) -> Tuple[Message, Message]:
+        """Store the user message and the generated clone message, and update session stats.
+        Uses db instead of the service's session when given.
+        """
+        db = db or self.db
+        rag_context_json = self._build_rag_context_json(rag_results)
 
         # Calculate response time
         response_time_ms = int((time.time() - start_time) * 1000)
 
-        # Create clone message
+        # Create both messages now that generation is done, so no write transaction is held
+        # open across the LLM call
+        user_msg = Message(
+            id=user_msg_id,
+            clone_id=self.clone_id,
+            session_id=session_id,
+            role='external_user',
+            content=user_message,
+            external_user_name=external_user_name or 'Owner',
+        )
         clone_msg = Message(
+            id=clone_msg_id,
             clone_id=self.clone_id,
             session_id=session_id,
             role='clone',
@@ -272,26 +292,30 @@ class ChatService:
             tokens_used=tokens_used,
             response_time_ms=response_time_ms,
         )
-        self.db.add(clone_msg)
-
-        # Update session stats
-        # FIX BUG #6: Use current time explicitly instead of clone_msg.created_at
-        # (created_at is set by database and won't have a value until after commit)
-        current_time = datetime.utcnow()
-        session.message_count = session.message_count + 2  # User message + clone message
-        session.last_message_at = current_time
+        db.add_all([user_msg, clone_msg])
+
+        # Update session stats with one atomic UPDATE: concurrent messages on the same
+        # session can't overwrite each other's count, and now() matches the messages' created_at
+        db.execute(
+            update(ChatSession)
+            .where(ChatSession.id == session_id)
+            .values(
+                message_count=ChatSession.message_count + 2,  # User message + clone message
+                last_message_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-        # Commit all changes
-        self.db.commit()
-        self.db.refresh(user_msg)
-        self.db.refresh(clone_msg)
-        self.db.refresh(session)
+        # Commit all changes, then reload both (expired) messages with one SELECT
+        # instead of a refresh per object
+        db.commit()
+        db.query(Message).filter(Message.id.in_([user_msg_id, clone_msg_id])).all()
 
         logger.info(
             "Clone response generated",
             session_id=session_id,
-            user_message_id=str(user_msg.id),
-            clone_message_id=str(clone_msg.id),
+            user_message_id=str(user_msg_id),
+            clone_message_id=str(clone_msg_id),
             tokens_used=tokens_used,
             response_time_ms=response_time_ms,
             rag_chunks=len(rag_results),
@@ -299,7 +323,232 @@ class ChatService:
 
         return user_msg, clone_msg
 
-    def submit_feedback(self, message_id: UUID, rating: int) -> Message:
+    def send_message_and_get_response(
+        self,
+        session_id: int,
+        user_message: str,
+        external_user_name: Optional[str] = None,
+    ) -> Tuple[Message, Message]:
+        """
+        Send a user message and generate clone response with RAG.
+        Returns tuple of (user_message, clone_message).
+        """
+        start_time = time.time()
+
+        session = self._prepare_session(session_id)
+
+        # Message IDs are generated here rather than by the database, so the messages can
+        # be written together after generation without a flush to learn their IDs
+        user_msg_id = uuid4()
+        clone_msg_id = uuid4()
+
+        logger.info(
+            "User message received",
+            session_id=session_id,
+            message_id=str(user_msg_id),
+            preview=user_message[:50]
+        )
+
+        # Retrieve RAG context (with RL boosting if scores exist)
+        logger.info("Retrieving RAG context", query_preview=user_message[:50])
+        rag_results = self.rag_retriever.retrieve(
+            query=user_message,
+            top_k=5,
+        )
+
+        logger.info("RAG context retrieved", chunks_count=len(rag_results))
+
+        # Get conversation history for context (only the messages the prompt includes).
+        # The current message isn't stored yet; build_messages appends it after the history.
+        conversation_history = self.get_recent_messages(session_id)
+
+        llm_messages = self._build_llm_messages(user_message, rag_results, conversation_history, session.clone)
+
+        # Generate clone response
+        logger.info("Generating clone response")
+        llm_response = self.llm_client.generate(
+            messages=llm_messages,
+            temperature=0.7,
+        )
+
+        # Get token usage
+        usage_stats = self.llm_client.get_usage_stats(llm_response)
+
+        return self._save_exchange(
+            session_id, user_msg_id, clone_msg_id, user_message, external_user_name, rag_results,
+            llm_response.choices[0].message.content, usage_stats.get("total_tokens", 0), start_time,
+        )
+
+    async def _aprepare_generation(
+        self,
+        session_id: int,
+        user_message: str,
+    ) -> Tuple[ChatSession, List[Dict], List[Dict[str, str]]]:
+        """Validate the session, retrieve context and build the LLM prompt for the async paths.
+
+        RAG retrieval runs concurrently with the conversation history query. Database work
+        runs in worker threads one step at a time, since the Session must not be used concurrently.
+        """
+        session = await asyncio.to_thread(self._prepare_session, session_id)
+
+        logger.info("User message received", session_id=session_id, preview=user_message[:50])
+
+        # Retrieval doesn't touch the database, so it overlaps the history query. Both are
+        # awaited before an error is raised, so the Session is idle again by then.
+        logger.info("Retrieving RAG context", query_preview=user_message[:50])
+        rag_results, conversation_history = await asyncio.gather(
+            self.rag_retriever.aretrieve(query=user_message, top_k=5),
+            asyncio.to_thread(self.get_recent_messages, session_id),
+            return_exceptions=True,
+        )
+        for result in (rag_results, conversation_history):
+            if isinstance(result, BaseException):
+                raise result
+
+        logger.info("RAG context retrieved", chunks_count=len(rag_results))
+
+        llm_messages = self._build_llm_messages(user_message, rag_results, conversation_history, session.clone)
+        return session, rag_results, llm_messages
+
+    async def asend_message_and_get_response(
+        self,
+        session_id: int,
+        user_message: str,
+        external_user_name: Optional[str] = None,
+    ) -> Tuple[Message, Message]:
+        """
+        Async send_message_and_get_response.
+        Retrieval overlaps the history query, and the LLM call doesn't block the event loop.
+
+        An identical message sent to the same session while one is still being answered
+        in this process (a double submit or client retry) waits for that one and returns
+        the same stored messages, instead of generating and storing a duplicate exchange.
+        """
+        key = (self.clone_id, session_id, user_message, external_user_name)
+        in_flight = _in_flight_messages.get(key)
+        if in_flight is not None:
+            logger.info("Joining in-flight identical message", session_id=session_id)
+            # shield: a cancelled duplicate request mustn't cancel the original
+            user_msg_id, clone_msg_id = await asyncio.shield(in_flight)
+            return await asyncio.to_thread(self._load_exchange, user_msg_id, clone_msg_id)
+
+        in_flight = asyncio.get_running_loop().create_future()
+        _in_flight_messages[key] = in_flight
+        try:
+            user_msg, clone_msg = await self._asend_message(session_id, user_message, external_user_name)
+        except asyncio.CancelledError:
+            in_flight.cancel()
+            raise
+        except Exception as e:
+            in_flight.set_exception(e)
+            # Mark the exception retrieved; it's raised here even if nobody joined
+            in_flight.exception()
+            raise
+        finally:
+            del _in_flight_messages[key]
+
+        in_flight.set_result((user_msg.id, clone_msg.id))
+        return user_msg, clone_msg
+
+    def _load_exchange(self, user_msg_id: UUID, clone_msg_id: UUID) -> Tuple[Message, Message]:
+        """Load a stored (user_message, clone_message) pair with one query"""
+        messages = {
+            message.id: message
+            for message in self.db.query(Message).filter(Message.id.in_([user_msg_id, clone_msg_id])).all()
+        }
+        return messages[user_msg_id], messages[clone_msg_id]
+
+    async def _asend_message(
+        self,
+        session_id: int,
+        user_message: str,
+        external_user_name: Optional[str],
+    ) -> Tuple[Message, Message]:
+        """Generate and store a response (asend_message_and_get_response without coalescing)"""
+        start_time = time.time()
+
+        session, rag_results, llm_messages = await self._aprepare_generation(session_id, user_message)
+
+        # Generate clone response
+        logger.info("Generating clone response")
+        llm_response = await self.llm_client.generate_async(
+            messages=llm_messages,
+            temperature=0.7,
+        )
+
+        # Get token usage
+        usage_stats = self.llm_client.get_usage_stats(llm_response)
+
+        return await asyncio.to_thread(
+            self._save_exchange,
+            session_id, uuid4(), uuid4(), user_message, external_user_name, rag_results,
+            llm_response.choices[0].message.content, usage_stats.get("total_tokens", 0), start_time,
+        )
+
+    async def astream_message_response(
+        self,
+        session_id: int,
+        user_message: str,
+        external_user_name: Optional[str] = None,
+    ) -> Tuple[UUID, UUID, AsyncIterator[str]]:
+        """
+        Streaming variant of asend_message_and_get_response.
+
+        The session is validated and context retrieved before this returns, so those errors
+        surface before any output. Returns (user_message_id, clone_message_id, chunks):
+        iterating chunks yields the clone response as it is generated, and both messages
+        are stored once the last chunk has been yielded. Nothing is stored if iteration
+        stops early (e.g. the client disconnects).
+
+        The messages are stored with a session of their own: iteration outlives the request,
+        so the request-scoped session may already be closed. The IDs have been sent to the
+        client by then, so a failed save is logged rather than raised.
+        """
+        start_time = time.time()
+
+        session, rag_results, llm_messages = await self._aprepare_generation(session_id, user_message)
+        user_msg_id = uuid4()
+        clone_msg_id = uuid4()
+
+        async def stream() -> AsyncIterator[str]:
+            logger.info("Streaming clone response")
+            parts = []
+            async for chunk in self.llm_client.generate_stream_async(
+                messages=llm_messages,
+                temperature=0.7,
+            ):
+                parts.append(chunk)
+                yield chunk
+
+            clone_response_text = "".join(parts)
+            # Streamed completions carry no usage stats, so count the tokens locally
+            tokens_used = (
+                self.llm_client.count_messages_tokens(llm_messages)
+                + self.llm_client.count_tokens(clone_response_text)
+            )
+            await asyncio.to_thread(save_exchange, clone_response_text, tokens_used)
+
+        def save_exchange(clone_response_text: str, tokens_used: int) -> None:
+            db = get_db_session()
+            try:
+                self._save_exchange(
+                    session_id, user_msg_id, clone_msg_id, user_message, external_user_name, rag_results,
+                    clone_response_text, tokens_used, start_time, db=db,
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to store streamed exchange",
+                    session_id=session_id,
+                    user_message_id=str(user_msg_id),
+                    clone_message_id=str(clone_msg_id),
+                    error=str(e),
+                )
+            finally:
+                db.close()
+
+        return user_msg_id, clone_msg_id, stream()
+
+    def submit_feedback(self, message_id: UUID, rating: int, update_scores: bool = True) -> Message:
         """
         Submit feedback for a clone message and update RL chunk scores.
 
@@ -307,10 +556,12 @@ class ChatService:
         1. Validates the feedback
         2. Updates the message's feedback_rating
         3. Updates chunk scores based on which chunks were used in this response
+           (unless update_scores is False, for callers that run update_chunk_scores later)
 
         Args:
             message_id: The clone message to rate
             rating: -1 (thumbs down) or 1 (thumbs up)
+            update_scores: Whether to update chunk scores before returning
 
         Returns:
             The updated message
@@ -338,7 +589,14 @@ class ChatService:
 
         # Update chunk scores for RL-based learning
         # This uses the RAG context stored with the message to know which chunks to update
-        if message.rag_context_json:
+        if message.rag_context_json and not update_scores:
+            logger.info(
+                "Feedback submitted (RL update deferred)",
+                message_id=str(message_id),
+                rating=rating,
+                session_id=message.session_id,
+            )
+        elif message.rag_context_json:
             chunks_updated = self.chunk_score_service.update_scores_from_feedback(
                 clone_id=self.clone_id,
                 rag_context=message.rag_context_json,
@@ -361,3 +619,30 @@ class ChatService:
 
         return message
 
+
+
+def update_chunk_scores(clone_id: UUID, rag_context: Dict, rating: int) -> None:
+    """
+    Update RL chunk scores for feedback that was recorded with update_scores=False.
+
+    Meant to run after the feedback response has been sent (e.g. as a FastAPI background
+    task), so it uses its own database session. Errors are logged, not raised: the rating
+    itself is already stored.
+    """
+    db = get_db_session()
+    try:
+        chunks_updated = ChunkScoreService(db).update_scores_from_feedback(
+            clone_id=clone_id,
+            rag_context=rag_context,
+            rating=rating,
+        )
+        logger.info(
+            "Deferred RL update applied",
+            clone_id=str(clone_id),
+            rating=rating,
+            chunks_updated=chunks_updated,
+        )
+    except Exception as e:
+        logger.error("Error updating chunk scores from feedback", error=str(e), clone_id=str(clone_id))
+    finally:
+        db.close()
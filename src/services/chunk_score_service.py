@@ -7,18 +7,124 @@ and update their scores using an exponential moving average.
 See docs/RL_OVERVIEW.md for detailed documentation on the RL system.
 """
 
-from typing import Dict
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
-from src.database.models import ChunkScore
+from src.config.settings import settings
+from src.database.models import ChunkScore, Message
 from src.rag.utils import RL_DECAY, RL_LEARNING_RATE, hash_chunk_content
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Score maps are reloaded at most this often per worker. Feedback drops the submitting
+# worker's copy and the shared Redis copy immediately; other workers pick up new scores
+# within LOCAL_SCORE_MAP_TTL_SECONDS.
+LOCAL_SCORE_MAP_TTL_SECONDS = 60
+REDIS_SCORE_MAP_TTL_SECONDS = 600
+LOCAL_SCORE_MAP_CACHE_SIZE = 128
+REDIS_KEY_PREFIX = "chunk_scores:"
+
+
+class ScoreMapCache:
+    """Per-clone chunk score maps: a local TTL LRU in front of an optional shared Redis tier.
+
+    Cached maps are shared between callers and must be treated as read-only.
+    Redis (enabled when REDIS_URL is set and the redis package is installed) errors
+    are logged and treated as misses, falling back to the database.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, maxsize: int = LOCAL_SCORE_MAP_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.redis = None
+
+        redis_url = redis_url or settings.redis_url
+        if redis_url:
+            try:
+                import redis
+                self.redis = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+            except ImportError:
+                logger.warning("redis package not installed, using local chunk score cache only")
+
+    def get(self, clone_id: UUID) -> Optional[Dict[str, float]]:
+        """Return the cached score map for a clone, or None on a miss"""
+        key = str(clone_id)
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, score_map = entry
+                if expires_at > time.monotonic():
+                    self._local.move_to_end(key)
+                    return score_map
+                del self._local[key]
+
+        if self.redis is None:
+            return None
+
+        try:
+            value = self.redis.get(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis chunk score get failed", error=str(e))
+            return None
+        if value is None:
+            return None
+
+        score_map = json.loads(value)
+        self._set_local(key, score_map)
+        return score_map
+
+    def set(self, clone_id: UUID, score_map: Dict[str, float]) -> None:
+        """Store a clone's score map in both tiers"""
+        key = str(clone_id)
+        self._set_local(key, score_map)
+
+        if self.redis is None:
+            return
+
+        try:
+            self.redis.setex(REDIS_KEY_PREFIX + key, REDIS_SCORE_MAP_TTL_SECONDS, json.dumps(score_map))
+        except Exception as e:
+            logger.warning("Redis chunk score set failed", error=str(e))
+
+    def invalidate(self, clone_id: UUID) -> None:
+        """Drop a clone's score map from both tiers after its scores change"""
+        key = str(clone_id)
+        with self._lock:
+            self._local.pop(key, None)
+
+        if self.redis is None:
+            return
+
+        try:
+            self.redis.delete(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis chunk score invalidate failed", error=str(e))
+
+    def _set_local(self, key: str, score_map: Dict[str, float]) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + LOCAL_SCORE_MAP_TTL_SECONDS, score_map)
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_score_map_cache() -> ScoreMapCache:
+    """Process-wide chunk score cache shared by all ChunkScoreServices"""
+    return ScoreMapCache()
+
 
 class ChunkScoreService:
     """Service for managing chunk quality scores based on user feedback.
@@ -34,8 +140,9 @@ class ChunkScoreService:
     - RL_MAX_BOOST (0.3): Maximum score adjustment during retrieval
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, score_cache: Optional[ScoreMapCache] = None):
         self.db = db
+        self.score_cache = score_cache or get_score_map_cache()
 
     def update_scores_from_feedback(
         self,
@@ -69,7 +176,8 @@ class ChunkScoreService:
             if not content:
                 continue
 
-            chunk_hash = hash_chunk_content(content)
+            # Messages store each chunk's hash; older ones only have the content
+            chunk_hash = chunk.get("chunk_hash") or hash_chunk_content(content)
 
             # PostgreSQL UPSERT with exponential moving average
             stmt = insert(ChunkScore).values(
@@ -88,6 +196,7 @@ class ChunkScoreService:
             updated_count += 1
 
         self.db.commit()
+        self.score_cache.invalidate(clone_id)
 
         logger.info(
             "Chunk scores updated from feedback",
@@ -103,6 +212,7 @@ class ChunkScoreService:
 
         This is called before RAG retrieval to get scores for boosting.
         Returns empty dict if no scores exist (graceful degradation).
+        Maps are cached (see ScoreMapCache), so the returned dict must not be modified.
 
         Args:
             clone_id: The clone to get scores for
@@ -110,11 +220,17 @@ class ChunkScoreService:
         Returns:
             Dictionary mapping chunk_hash to score
         """
-        rows = self.db.query(ChunkScore).filter(
+        score_map = self.score_cache.get(clone_id)
+        if score_map is not None:
+            return score_map
+
+        # Only the two mapped columns are needed; skip building ORM objects
+        rows = self.db.query(ChunkScore.chunk_hash, ChunkScore.score).filter(
             ChunkScore.clone_id == clone_id
         ).all()
 
-        score_map = {row.chunk_hash: row.score for row in rows}
+        score_map = {chunk_hash: score for chunk_hash, score in rows}
+        self.score_cache.set(clone_id, score_map)
 
         if score_map:
             logger.debug(
@@ -125,6 +241,42 @@ class ChunkScoreService:
 
         return score_map
 
+    def warm_score_maps(self, max_clones: int, min_messages: int, since_hours: int = 24) -> List[UUID]:
+        """Pre-load the score maps of the busiest recent clones into the cache.
+
+        Clones with at least min_messages messages in the last since_hours hours are
+        loaded (at most max_clones, busiest first) with a single query, so their first
+        chats after a restart don't each pay for loading the map.
+
+        Returns:
+            IDs of the clones whose score maps were loaded
+        """
+        clone_ids = [
+            clone_id
+            for (clone_id,) in self.db.query(Message.clone_id)
+            .filter(Message.created_at >= func.now() - timedelta(hours=since_hours))
+            .group_by(Message.clone_id)
+            .having(func.count(Message.id) >= min_messages)
+            .order_by(func.count(Message.id).desc())
+            .limit(max_clones)
+            .all()
+        ]
+        if not clone_ids:
+            return []
+
+        score_maps: Dict[UUID, Dict[str, float]] = {clone_id: {} for clone_id in clone_ids}
+        rows = self.db.query(ChunkScore.clone_id, ChunkScore.chunk_hash, ChunkScore.score).filter(
+            ChunkScore.clone_id.in_(clone_ids)
+        ).all()
+        for clone_id, chunk_hash, score in rows:
+            score_maps[clone_id][chunk_hash] = score
+
+        for clone_id, score_map in score_maps.items():
+            self.score_cache.set(clone_id, score_map)
+
+        logger.info("Chunk score maps warmed", clones=len(clone_ids), scores_count=len(rows))
+        return clone_ids
+
     def get_clone_stats(self, clone_id: UUID) -> Dict:
         """Get statistics about chunk scores for a clone (for debugging/analytics).
 
@@ -134,8 +286,6 @@ class ChunkScoreService:
         Returns:
             Dictionary with score statistics
         """
-        from sqlalchemy import func
-
         stats = self.db.query(
             func.count(ChunkScore.chunk_hash).label('total_chunks'),
             func.avg(ChunkScore.score).label('avg_score'),
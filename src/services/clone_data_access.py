@@ -5,7 +5,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from src.database.models import Clone, Tenant, Document, Insight
-from src.rag.clone_vector_store import CloneVectorStore
+from src.rag.clone_vector_store import CloneVectorStore, get_clone_vector_store
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -190,13 +190,10 @@ class CloneDataAccessService:
     
     def get_vector_store(self) -> CloneVectorStore:
         """
-        Get a CloneVectorStore instance for this clone.
+        Get the (shared) CloneVectorStore instance for this clone.
         All operations will be automatically filtered by clone_id and tenant_id.
         
         Returns:
             CloneVectorStore instance
         """
-        return CloneVectorStore(
-            clone_id=self.clone_id,
-            tenant_id=self.tenant_id
-        )
+        return get_clone_vector_store(self.clone_id, self.tenant_id)
@@ -61,15 +61,24 @@ class S3Client:
             logger.error("Error getting object from S3", error=str(e), s3_key=s3_key)
             return None
     
-    def put_object(self, s3_key: str, content: bytes, content_type: str = "application/octet-stream") -> bool:
+    def put_object(
+        self,
+        s3_key: str,
+        content: bytes,
+        content_type: str = "application/octet-stream",
+        content_encoding: Optional[str] = None,
+    ) -> bool:
         """Put an object to S3"""
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=content,
-                ContentType=content_type,
-            )
+            put_kwargs = {
+                "Bucket": self.bucket_name,
+                "Key": s3_key,
+                "Body": content,
+                "ContentType": content_type,
+            }
+            if content_encoding:
+                put_kwargs["ContentEncoding"] = content_encoding
+            self.s3_client.put_object(**put_kwargs)
             logger.info("Object put to S3", s3_key=s3_key, bucket=self.bucket_name)
             return True
         except ClientError as e:
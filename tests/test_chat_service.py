@@ -0,0 +1,143 @@
+"""Tests for ChatService"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+from src.services.chat_service import ChatService
+
+
+@pytest.fixture
+def chat_service():
+    """Create a ChatService over a mocked session, retriever and LLM client"""
+    clone_id = uuid4()
+    db = Mock()
+    session = Mock(id=1, clone_id=clone_id, message_count=0, clone=Mock(first_name="Ada", last_name="Lovelace"))
+    db.query.return_value.options.return_value.filter.return_value.first.return_value = session
+    db.query.return_value.filter.return_value.all.return_value = []
+    db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [
+        Mock(role="clone", content="earlier"),
+        Mock(role="external_user", content="before that"),
+    ]
+
+    rag_retriever = Mock()
+    rag_retriever.format_context.return_value = "context"
+    rag_retriever.aretrieve = AsyncMock(return_value=[{
+        "text": "chunk",
+        "metadata": {"source": "notes", "chunk_hash": "stored-hash", "tenant_id": "t", "clone_id": "c"},
+        "distance": 0.2,
+    }])
+
+    llm_client = Mock()
+    llm_client.generate_async = AsyncMock(return_value=Mock(choices=[Mock(message=Mock(content="reply"))]))
+    llm_client.get_usage_stats.return_value = {"total_tokens": 7}
+
+    return ChatService(clone_id=clone_id, tenant_id=uuid4(), db=db, rag_retriever=rag_retriever, llm_client=llm_client)
+
+
+def test_asend_message_generates_and_stores_exchange(chat_service):
+    """Test that the async path retrieves, prompts with history oldest first, and stores both messages"""
+    user_msg, clone_msg = asyncio.run(chat_service.asend_message_and_get_response(1, "hello"))
+
+    prompt = chat_service.llm_client.generate_async.call_args.kwargs["messages"]
+    assert [m["content"] for m in prompt[1:]] == ["before that", "earlier", "hello"]
+    assert "Ada Lovelace" in prompt[0]["content"]
+    assert (user_msg.content, clone_msg.content) == ("hello", "reply")
+    assert clone_msg.tokens_used == 7
+    assert clone_msg.rag_context_json["chunks"] == [
+        {"content": "chunk", "score": 0.8, "chunk_hash": "stored-hash", "metadata": {"source": "notes"}}
+    ]
+    chat_service.db.add_all.assert_called_once_with([user_msg, clone_msg])
+    chat_service.db.commit.assert_called_once()
+    chat_service.llm_client.generate.assert_not_called()
+
+
+def test_asend_message_raises_retrieval_errors_without_storing(chat_service):
+    """Test that a failed retrieval surfaces and nothing is written"""
+    chat_service.rag_retriever.aretrieve.side_effect = RuntimeError("pinecone down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(chat_service.asend_message_and_get_response(1, "hello"))
+
+    chat_service.db.add_all.assert_not_called()
+    chat_service.llm_client.generate_async.assert_not_called()
+
+
+def consume_stream(chat_service):
+    """Stream a reply to "hello", returning (user_msg_id, clone_msg_id, received chunks)"""
+    async def fake_stream(messages, temperature):
+        for chunk in ("Hel", "lo"):
+            yield chunk
+
+    chat_service.llm_client.generate_stream_async = fake_stream
+    chat_service.llm_client.count_messages_tokens.return_value = 5
+    chat_service.llm_client.count_tokens.return_value = 2
+
+    async def consume():
+        user_msg_id, clone_msg_id, chunks = await chat_service.astream_message_response(1, "hello")
+        return user_msg_id, clone_msg_id, [chunk async for chunk in chunks]
+
+    return asyncio.run(consume())
+
+
+def test_astream_message_yields_chunks_then_stores_exchange(chat_service):
+    """Test that streamed chunks reach the caller and the full reply is stored afterwards
+    with a session of its own, not the request's"""
+    save_db = Mock()
+    with patch("src.services.chat_service.get_db_session", return_value=save_db):
+        user_msg_id, clone_msg_id, received = consume_stream(chat_service)
+
+    assert received == ["Hel", "lo"]
+    chat_service.db.add_all.assert_not_called()
+    user_msg, clone_msg = save_db.add_all.call_args.args[0]
+    assert (user_msg.id, clone_msg.id) == (user_msg_id, clone_msg_id)
+    assert clone_msg.content == "Hello"
+    assert clone_msg.tokens_used == 7
+    save_db.commit.assert_called_once()
+    save_db.close.assert_called_once()
+
+
+def test_astream_message_logs_failed_save(chat_service):
+    """Test that a failed save after streaming is logged instead of raised, and the session closed"""
+    save_db = Mock()
+    save_db.commit.side_effect = RuntimeError("db down")
+    with patch("src.services.chat_service.get_db_session", return_value=save_db), \
+            patch("src.services.chat_service.logger") as logger:
+        user_msg_id, clone_msg_id, received = consume_stream(chat_service)
+
+    assert received == ["Hel", "lo"]
+    save_db.close.assert_called_once()
+    assert logger.error.call_args.kwargs["clone_message_id"] == str(clone_msg_id)
+
+
+def test_submit_feedback_can_defer_score_updates(chat_service):
+    """Test that update_scores=False stores the rating without touching chunk scores"""
+    message = Mock(clone_id=chat_service.clone_id, role="clone", rag_context_json={"chunks": [{"content": "a"}]})
+    chat_service.db.query.return_value.filter.return_value.first.return_value = message
+    chat_service.chunk_score_service = Mock()
+
+    assert chat_service.submit_feedback(uuid4(), 1, update_scores=False) is message
+
+    assert message.feedback_rating == 1
+    chat_service.db.commit.assert_called_once()
+    chat_service.chunk_score_service.update_scores_from_feedback.assert_not_called()
+
+
+def test_identical_concurrent_messages_share_one_exchange(chat_service):
+    """Test that a duplicate of an in-flight message waits for it instead of generating again"""
+    stored = {}
+    chat_service.db.add_all.side_effect = lambda messages: stored.update({m.id: m for m in messages})
+    chat_service.db.query.return_value.filter.return_value.all.side_effect = lambda: list(stored.values())
+
+    async def send_twice():
+        return await asyncio.gather(
+            chat_service.asend_message_and_get_response(1, "hello"),
+            chat_service.asend_message_and_get_response(1, "hello"),
+        )
+
+    first, second = asyncio.run(send_twice())
+
+    assert chat_service.llm_client.generate_async.await_count == 1
+    chat_service.db.add_all.assert_called_once()
+    assert [m.id for m in first] == [m.id for m in second]
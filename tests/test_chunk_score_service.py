@@ -0,0 +1,67 @@
+"""Tests for ChunkScoreService"""
+
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from src.services.chunk_score_service import ChunkScoreService, ScoreMapCache
+
+
+def make_service(rows):
+    """Create a ChunkScoreService over a mocked session whose score query returns rows"""
+    db = Mock()
+    db.query.return_value.filter.return_value.all.return_value = rows
+    return ChunkScoreService(db, score_cache=ScoreMapCache())
+
+
+def test_get_score_map_is_cached_per_clone():
+    """Test that repeated lookups for a clone query the database once"""
+    service = make_service([("hash-a", 0.5), ("hash-b", -0.1)])
+    clone_id = uuid4()
+
+    assert service.get_score_map(clone_id) == {"hash-a": 0.5, "hash-b": -0.1}
+    assert service.get_score_map(clone_id) == {"hash-a": 0.5, "hash-b": -0.1}
+    assert service.db.query.call_count == 1
+
+    service.get_score_map(uuid4())
+    assert service.db.query.call_count == 2
+
+
+def test_feedback_invalidates_cached_score_map():
+    """Test that updating scores from feedback forces the next lookup to reload"""
+    service = make_service([])
+    clone_id = uuid4()
+    service.get_score_map(clone_id)
+
+    service.update_scores_from_feedback(clone_id, {"chunks": [{"content": "text"}]}, rating=1)
+    service.get_score_map(clone_id)
+
+    assert service.db.query.call_count == 2
+
+
+def test_feedback_uses_stored_chunk_hash():
+    """Test that a chunk hash stored with the message is used instead of re-hashing the content"""
+    service = make_service([])
+
+    with patch("src.services.chunk_score_service.hash_chunk_content") as hash_chunk_content:
+        updated = service.update_scores_from_feedback(
+            uuid4(), {"chunks": [{"content": "text", "chunk_hash": "stored"}]}, rating=1
+        )
+
+    assert updated == 1
+    hash_chunk_content.assert_not_called()
+    assert service.db.execute.call_args.args[0].compile().params["chunk_hash"] == "stored"
+
+
+def test_warm_score_maps_caches_busy_clones():
+    """Test that warming loads every busy clone's map with one score query, including empty maps"""
+    busy, quiet = uuid4(), uuid4()
+    service = make_service([(busy, "hash-a", 0.5)])
+    active_query = service.db.query.return_value.filter.return_value.group_by.return_value
+    active_query.having.return_value.order_by.return_value.limit.return_value.all.return_value = [(busy,), (quiet,)]
+
+    assert service.warm_score_maps(max_clones=10, min_messages=5) == [busy, quiet]
+    assert service.db.query.call_count == 2
+
+    assert service.get_score_map(busy) == {"hash-a": 0.5}
+    assert service.get_score_map(quiet) == {}
+    assert service.db.query.call_count == 2
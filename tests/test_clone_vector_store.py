@@ -0,0 +1,62 @@
+"""Tests for CloneVectorStore"""
+
+import pytest
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from src.rag.clone_vector_store import CloneVectorStore, get_clone_vector_store
+
+
+@pytest.fixture
+def clone_store():
+    """Create a CloneVectorStore over a mocked PineconeStore"""
+    return CloneVectorStore(clone_id=uuid4(), tenant_id=uuid4(), base_store=Mock())
+
+
+def test_search_keeps_id_filters_by_default(clone_store):
+    """Test that validated tenant_id/clone_id filter conditions are sent to Pinecone unchanged"""
+    filter_metadata = {"tenant_id": str(clone_store.tenant_id), "clone_id": str(clone_store.clone_id), "source": "slack"}
+
+    clone_store.search("hello", filter_metadata=filter_metadata)
+
+    assert clone_store.base_store.search.call_args.kwargs["filter_metadata"] == filter_metadata
+
+
+def test_search_drops_namespace_implied_filters_when_enabled(clone_store, monkeypatch):
+    """Test that tenant_id/clone_id filter conditions are stripped only when opted in"""
+    monkeypatch.setattr("src.rag.clone_vector_store.settings.pinecone_strip_namespace_id_filters", True)
+    clone_store.search(
+        "hello",
+        filter_metadata={"tenant_id": str(clone_store.tenant_id), "clone_id": str(clone_store.clone_id), "source": "slack"},
+    )
+    assert clone_store.base_store.search.call_args.kwargs["filter_metadata"] == {"source": "slack"}
+
+    clone_store.search("hello", filter_metadata={"clone_id": str(clone_store.clone_id)})
+    assert clone_store.base_store.search.call_args.kwargs["filter_metadata"] is None
+
+
+def test_search_rejects_other_clone_filter(clone_store):
+    """Test that a filter for another clone is still rejected"""
+    with pytest.raises(ValueError):
+        clone_store.search("hello", filter_metadata={"clone_id": str(uuid4())})
+
+
+def test_add_texts_does_not_modify_caller_metadata(clone_store):
+    """Test that metadata already carrying this clone's IDs reaches the base store as a copy"""
+    metadata = {"tenant_id": str(clone_store.tenant_id), "clone_id": str(clone_store.clone_id)}
+
+    clone_store.add_texts(["hello"], metadatas=[metadata])
+
+    (passed,) = clone_store.base_store.add_texts.call_args.kwargs["metadatas"]
+    assert passed == metadata
+    assert passed is not metadata
+
+
+def test_get_clone_vector_store_is_shared_per_clone():
+    """Test that the same clone gets the same store and another clone a different one"""
+    clone_id, tenant_id = uuid4(), uuid4()
+    with patch("src.rag.clone_vector_store.PineconeStore"):
+        first = get_clone_vector_store(clone_id, tenant_id)
+        assert get_clone_vector_store(clone_id, tenant_id) is first
+        assert get_clone_vector_store(uuid4(), tenant_id) is not first
+    get_clone_vector_store.cache_clear()
@@ -0,0 +1,98 @@
+"""Tests for EmbeddingService"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.rag.embeddings import EmbeddingCache, EmbeddingService
+
+
+def _embeddings_response(inputs):
+    """Fake embeddings response: each text embeds to [len(text)]"""
+    return Mock(data=[Mock(embedding=[float(len(text))]) for text in inputs])
+
+
+@pytest.fixture
+def embedding_service():
+    """Create an EmbeddingService with a mocked OpenAI client"""
+    service = EmbeddingService(api_key="test-key", model="text-embedding-3-small", cache=EmbeddingCache())
+    service.client = Mock()
+    service.client.embeddings.create.side_effect = lambda model, input: _embeddings_response(input)
+    return service
+
+
+def test_embed_texts_preserves_order_across_batches(embedding_service):
+    """Test that concurrently embedded batches are returned in input order"""
+    texts = ["a" * n for n in range(1, 8)]
+
+    embeddings = embedding_service.embed_texts(texts, batch_size=2)
+
+    assert embeddings == [[float(n)] for n in range(1, 8)]
+    assert embedding_service.client.embeddings.create.call_count == 4
+
+
+def test_embed_texts_failed_batch_yields_empty_embeddings(embedding_service):
+    """Test that one failing batch doesn't fail the others"""
+    def create(model, input):
+        if "bad" in input:
+            raise RuntimeError("boom")
+        return _embeddings_response(input)
+
+    embedding_service.client.embeddings.create.side_effect = create
+
+    embeddings = embedding_service.embed_texts(["ok", "bad", "fine"], batch_size=2)
+
+    assert embeddings == [[], [], [4.0]]
+
+
+def test_embed_texts_async_preserves_order(embedding_service):
+    """Test the async batch path returns embeddings in input order"""
+    async_client = Mock()
+    async_client.embeddings.create = AsyncMock(side_effect=lambda model, input: _embeddings_response(input))
+    embedding_service._async_client = async_client
+
+    embeddings = asyncio.run(embedding_service.embed_texts_async(["a", "bb", "ccc"], batch_size=2))
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+
+
+def test_embed_texts_dedupes_and_caches(embedding_service):
+    """Test that duplicate and previously embedded texts are not sent to the API"""
+    assert embedding_service.embed_texts(["a", "bb", "a"]) == [[1.0], [2.0], [1.0]]
+    assert embedding_service.client.embeddings.create.call_args.kwargs["input"] == ["a", "bb"]
+
+    assert embedding_service.embed_texts(["bb", "ccc"]) == [[2.0], [3.0]]
+    assert embedding_service.client.embeddings.create.call_args.kwargs["input"] == ["ccc"]
+
+    assert embedding_service.embed_text("a") == [1.0]
+    assert embedding_service.client.embeddings.create.call_count == 2
+
+
+def test_embed_texts_does_not_cache_failed_batches(embedding_service):
+    """Test that texts from a failed batch are retried on the next call"""
+    embedding_service.client.embeddings.create.side_effect = RuntimeError("boom")
+    assert embedding_service.embed_texts(["a"]) == [[]]
+
+    embedding_service.client.embeddings.create.side_effect = lambda model, input: _embeddings_response(input)
+    assert embedding_service.embed_texts(["a"]) == [[1.0]]
+
+
+def test_embedding_cache_persists_to_disk(tmp_path):
+    """Test that embeddings written to the SQLite tier are readable by a new cache"""
+    db_path = str(tmp_path / "embeddings.sqlite")
+    key = EmbeddingCache.key("text-embedding-3-small", "hello")
+
+    EmbeddingCache(db_path=db_path).set(key, [0.5, -0.25, 1.0])
+
+    assert EmbeddingCache(db_path=db_path).get(key) == [0.5, -0.25, 1.0]
+
+
+def test_async_client_is_shared_with_llm_client():
+    """Test that EmbeddingServices reuse the AsyncOpenAI client LLMClient uses for the same key"""
+    from src.llm.client import LLMClient
+
+    first = EmbeddingService(api_key="shared-key", cache=EmbeddingCache())
+    second = EmbeddingService(api_key="shared-key", cache=EmbeddingCache())
+
+    assert first.async_client is second.async_client
+    assert first.async_client is LLMClient(api_key="shared-key", model="gpt-4").async_client
@@ -1,6 +1,7 @@
 """Tests for ingestion pipeline"""
 
 import pytest
+from unittest.mock import Mock
 
 from src.ingestion.chunking import TextChunker
 
@@ -30,3 +31,77 @@ def test_chunk_by_sentences(text_chunker):
     assert all("text" in chunk for chunk in chunks)
 
 
+
+
+@pytest.fixture
+def slack_ingester():
+    """Create a Slack ingester with a mocked S3 client"""
+    from src.ingestion.slack_ingester import SlackIngester
+
+    s3_client = Mock()
+    s3_client.put_object.return_value = True
+    return SlackIngester(bot_token="xoxb-test", s3_client=s3_client)
+
+
+def test_slack_raw_messages_flushed_to_unique_keys(slack_ingester):
+    """Test that each flush writes a new S3 object and clears the buffer"""
+    slack_ingester.ingest_messages([{"text": "First message", "ts": "1"}])
+    assert slack_ingester.flush_raw_messages()
+    slack_ingester.ingest_messages([{"text": "Second message", "ts": "2"}])
+    assert slack_ingester.flush_raw_messages()
+
+    calls = slack_ingester.s3_client.put_object.call_args_list
+    keys = [c.args[0] for c in calls]
+    assert len(keys) == 2
+    assert keys[0] != keys[1]
+    assert all(key.startswith("raw/slack/") and key.endswith(".json.gz") for key in keys)
+    assert all(c.kwargs["content_encoding"] == "gzip" for c in calls)
+    assert slack_ingester._raw_messages_buffer == []
+
+
+def test_slack_raw_messages_kept_when_upload_fails(slack_ingester):
+    """Test that buffered messages survive a failed upload"""
+    slack_ingester.s3_client.put_object.return_value = False
+    slack_ingester.ingest_messages([{"text": "Message", "ts": "1"}])
+
+    assert not slack_ingester.flush_raw_messages()
+    assert len(slack_ingester._raw_messages_buffer) == 1
+
+
+def test_slack_short_messages_packed_by_conversation(slack_ingester):
+    """Test that short messages from the same user/channel are packed into one chunk"""
+    messages = [
+        {"text": "Hello team", "ts": "1", "user": "U1", "channel": "C1"},
+        {"text": "", "ts": "2", "user": "U1", "channel": "C1"},
+        {"text": "Quick update", "ts": "3", "user": "U1", "channel": "C1"},
+        {"text": "Other user", "ts": "4", "user": "U2", "channel": "C1"},
+    ]
+
+    chunks = slack_ingester.ingest_messages(messages)
+
+    assert len(chunks) == 2
+    assert chunks[0]["text"] == "Hello team\nQuick update"
+    assert chunks[0]["metadata"]["message_ids"] == ["1", "3"]
+    assert chunks[0]["metadata"]["user_id"] == "U1"
+    assert chunks[1]["metadata"]["message_id"] == "4"
+    assert chunks[1]["metadata"]["user_id"] == "U2"
+
+
+def test_slack_user_messages_fetched_via_search(slack_ingester):
+    """Test that search matches are paged and normalized to channel ids"""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    client = Mock()
+    client.search_messages = AsyncMock(side_effect=[
+        {"messages": {"matches": [{"ts": "1", "user": "U1", "channel": {"id": "C1"}}], "paging": {"pages": 2}}},
+        {"messages": {"matches": [{"ts": "2", "user": "U1", "channel": {"id": "C2"}}], "paging": {"pages": 2}}},
+    ])
+
+    messages = asyncio.run(
+        slack_ingester.fetch_user_messages_via_search_async("U1", client=client)
+    )
+
+    assert [m["channel"] for m in messages] == ["C1", "C2"]
+    assert client.search_messages.call_args.kwargs["query"] == "from:<@U1>"
+    assert client.search_messages.call_count == 2
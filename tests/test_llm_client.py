@@ -0,0 +1,122 @@
+"""Tests for LLMClient"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.llm.client import LLMClient, TOKENIZER_THREADS, TOKENS_PER_MESSAGE, TOKENS_REPLY_PRIMING
+
+
+@pytest.fixture
+def llm_client():
+    """Create an LLM client with a dummy API key"""
+    return LLMClient(api_key="test-key", model="gpt-4")
+
+
+@pytest.fixture
+def messages():
+    """Create a sample messages array"""
+    return [
+        {"role": "system", "content": "You are a helpful clone."},
+        {"role": "user", "content": "Hello there"},
+    ]
+
+
+def test_count_messages_tokens_adds_message_overhead(llm_client, messages):
+    """Test that per-message and reply-priming overhead is added to content tokens"""
+    encoder = Mock()
+    encoder.encode_batch.return_value = [[1, 2, 3], [4, 5]]
+
+    with patch("src.llm.client._get_encoder", return_value=encoder):
+        total = llm_client.count_messages_tokens(messages)
+
+    assert total == 5 + TOKENS_PER_MESSAGE * 2 + TOKENS_REPLY_PRIMING
+    encoder.encode_batch.assert_called_once_with(
+        [msg["content"] for msg in messages], num_threads=TOKENIZER_THREADS, disallowed_special=()
+    )
+
+
+def test_count_messages_tokens_falls_back_without_encoder(llm_client, messages):
+    """Test the character heuristic is used when no encoder can be loaded"""
+    with patch("src.llm.client._get_encoder", return_value=None):
+        total = llm_client.count_messages_tokens(messages)
+
+    expected_content = sum(len(msg["content"]) // 4 for msg in messages)
+    assert total == expected_content + TOKENS_PER_MESSAGE * 2 + TOKENS_REPLY_PRIMING
+
+
+def test_count_tokens_falls_back_when_encoding_download_fails(llm_client):
+    """Test that a failing BPE download degrades to the heuristic instead of raising"""
+    with patch("src.llm.client._load_encoder", side_effect=OSError("offline")):
+        assert llm_client.count_tokens("a" * 40) == 10
+
+
+def test_generate_stream_async_yields_content_deltas(llm_client, messages):
+    """Test that the async stream yields only non-empty content deltas"""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    def chunk(content):
+        return Mock(choices=[Mock(delta=Mock(content=content))])
+
+    async def stream():
+        for content in ["Hel", None, "lo"]:
+            yield chunk(content)
+
+    async_client = Mock()
+    async_client.chat.completions.create = AsyncMock(return_value=stream())
+    llm_client._async_client = async_client
+
+    async def collect():
+        return [delta async for delta in llm_client.generate_stream_async(messages)]
+
+    assert asyncio.run(collect()) == ["Hel", "lo"]
+    assert async_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+def test_async_client_is_shared_per_api_key():
+    """Test that LLMClients with the same API key share one AsyncOpenAI client"""
+    first = LLMClient(api_key="shared-key", model="gpt-4")
+    second = LLMClient(api_key="shared-key", model="gpt-4")
+
+    assert first.async_client is second.async_client
+    assert LLMClient(api_key="other-key", model="gpt-4").async_client is not first.async_client
+
+
+def _api_error(error_cls, status_code, headers=None):
+    """Build an OpenAI status error around a fake HTTP response"""
+    import httpx
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_cls("error", response=response, body=None)
+
+
+def test_generate_does_not_retry_authentication_errors(llm_client, messages):
+    """Test that non-retryable errors are raised on the first attempt"""
+    from openai import AuthenticationError
+
+    llm_client.client = Mock()
+    llm_client.client.chat.completions.create.side_effect = _api_error(AuthenticationError, 401)
+
+    with patch("src.llm.client.time.sleep") as sleep:
+        with pytest.raises(AuthenticationError):
+            llm_client.generate(messages)
+
+    assert llm_client.client.chat.completions.create.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_generate_honors_retry_after_on_rate_limit(llm_client, messages):
+    """Test that rate-limit retries wait for the server's Retry-After"""
+    from openai import RateLimitError
+
+    llm_client.client = Mock()
+    llm_client.client.chat.completions.create.side_effect = [
+        _api_error(RateLimitError, 429, {"retry-after": "2"}),
+        "response",
+    ]
+
+    with patch("src.llm.client.time.sleep") as sleep:
+        assert llm_client.generate(messages) == "response"
+
+    sleep.assert_called_once_with(2.0)
@@ -0,0 +1,192 @@
+"""Tests for PineconeStore"""
+
+import pytest
+from concurrent.futures import Future
+from unittest.mock import Mock, call, patch
+from uuid import uuid4
+
+from pinecone.exceptions import NotFoundException, PineconeApiException
+
+from src.rag import pinecone_store as pinecone_store_module
+from src.rag.pinecone_store import PineconeStore
+from src.rag.utils import hash_chunk_content
+
+
+@pytest.fixture
+def pinecone_store():
+    """Create a PineconeStore with mocked Pinecone client and embedding service"""
+    embedding_service = Mock()
+    embedding_service.get_embedding_dimension.return_value = 3
+    embedding_service.embed_texts.side_effect = lambda texts: [[float(len(text)), 0.0, 0.0] for text in texts]
+    embedding_service.embed_text.side_effect = lambda text: [float(len(text)), 0.0, 0.0]
+
+    with patch("src.rag.pinecone_store.Pinecone"):
+        store = PineconeStore(index_name="test-index", embedding_service=embedding_service, batch_size=2)
+    store.index = Mock()
+    yield store
+    pinecone_store_module._get_client.cache_clear()
+    pinecone_store_module._index_handles.clear()
+
+
+def test_add_texts_upserts_in_parallel_batches(pinecone_store):
+    """Test that vectors are split into batch_size upserts sent with async_req"""
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    ids = pinecone_store.add_texts(texts, ids=[f"id-{i}" for i in range(5)], namespace="ns")
+
+    assert ids == [f"id-{i}" for i in range(5)]
+    calls = pinecone_store.index.upsert.call_args_list
+    assert [[v["id"] for v in call.kwargs["vectors"]] for call in calls] == [
+        ["id-0", "id-1"], ["id-2", "id-3"], ["id-4"],
+    ]
+    assert all(call.kwargs["async_req"] and call.kwargs["namespace"] == "ns" for call in calls)
+    assert pinecone_store.index.upsert.return_value.get.call_count == 3
+
+
+def test_add_texts_raises_when_a_batch_fails(pinecone_store):
+    """Test that a failed batch upsert surfaces to the caller"""
+    pinecone_store.index.upsert.return_value.get.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        pinecone_store.add_texts(["a", "bb"], namespace="ns")
+
+
+def test_add_texts_upserts_each_chunk_before_embedding_the_next(pinecone_store, monkeypatch):
+    """Test that embedding and upserting are pipelined chunk by chunk"""
+    monkeypatch.setattr("src.rag.pinecone_store.EMBEDDING_CHUNK_SIZE", 3)
+    events = []
+    pinecone_store.embedding_service.embed_texts.side_effect = lambda texts: (
+        events.append(("embed", len(texts))) or [[1.0, 0.0, 0.0] for _ in texts]
+    )
+    pinecone_store.index.upsert.side_effect = lambda vectors, **kwargs: (
+        events.append(("upsert", len(vectors))) or Mock()
+    )
+
+    pinecone_store.add_texts(["a", "b", "c", "d", "e"], namespace="ns")
+
+    assert events == [("embed", 3), ("upsert", 2), ("upsert", 1), ("embed", 2), ("upsert", 2)]
+
+
+def test_delete_by_filter_uses_server_side_filter(pinecone_store):
+    """Test that filter deletes are a single delete call without a query"""
+    assert pinecone_store.delete(filter_metadata={"source": "slack"}, namespace="ns")
+
+    pinecone_store.index.delete.assert_called_once_with(filter={"source": {"$eq": "slack"}}, namespace="ns")
+    pinecone_store.index.query.assert_not_called()
+
+
+def test_delete_by_filter_falls_back_to_query(pinecone_store, monkeypatch):
+    """Test that indexes rejecting filter deletes delete the matching IDs in batches"""
+    monkeypatch.setattr("src.rag.pinecone_store.DELETE_BATCH_SIZE", 2)
+    pinecone_store.index.delete.side_effect = [PineconeApiException(status=400, reason="unsupported"), Mock(), Mock()]
+    pinecone_store.index.query.return_value = Mock(matches=[Mock(id=f"id-{i}") for i in range(3)])
+
+    assert pinecone_store.delete(filter_metadata={"source": "slack"}, namespace="ns")
+
+    id_batches = [call.kwargs.get("ids") for call in pinecone_store.index.delete.call_args_list[1:]]
+    assert id_batches == [["id-0", "id-1"], ["id-2"]]
+
+
+def test_index_handle_is_reused_across_stores(pinecone_store):
+    """Test that constructing another store doesn't look the index up again"""
+    with patch("src.rag.pinecone_store.Pinecone"):
+        first = PineconeStore(index_name="other-index", embedding_service=pinecone_store.embedding_service)
+        second = PineconeStore(index_name="other-index", embedding_service=pinecone_store.embedding_service)
+
+    assert second.pc is first.pc
+    assert second.index is first.index
+    assert first.pc.describe_index.call_args_list.count(call("other-index")) == 1
+    first.pc.list_indexes.assert_not_called()
+
+
+def test_new_index_is_polled_until_ready(pinecone_store, monkeypatch):
+    """Test that index creation waits on describe_index status rather than a fixed sleep"""
+    sleeps = []
+    monkeypatch.setattr("src.rag.pinecone_store.time.sleep", sleeps.append)
+    with patch("src.rag.pinecone_store.Pinecone") as pinecone_cls:
+        pinecone_store_module._get_client.cache_clear()
+        pinecone_cls.return_value.describe_index.side_effect = [
+            NotFoundException(status=404, reason="not found"),
+            Mock(status={"ready": False}),
+            Mock(status={"ready": True}),
+        ]
+        PineconeStore(index_name="new-index", embedding_service=pinecone_store.embedding_service)
+
+    pinecone_cls.return_value.create_index.assert_called_once()
+    assert sleeps == [pinecone_store_module.INDEX_POLL_INTERVAL_SECONDS]
+
+
+def test_add_texts_does_not_modify_caller_metadata(pinecone_store):
+    """Test that the text is attached to a copy of caller-owned metadata"""
+    metadatas = [{"source": "a"}, {"source": "b"}]
+
+    pinecone_store.add_texts(["x", "y"], metadatas=metadatas, namespace="ns")
+
+    vectors = pinecone_store.index.upsert.call_args.kwargs["vectors"]
+    assert [v["metadata"] for v in vectors] == [
+        {"source": "a", "text": "x", "chunk_hash": hash_chunk_content("x")},
+        {"source": "b", "text": "y", "chunk_hash": hash_chunk_content("y")},
+    ]
+    assert metadatas == [{"source": "a"}, {"source": "b"}]
+
+
+def test_add_texts_waits_on_grpc_futures(pinecone_store):
+    """Test that gRPC-style futures from async upserts are awaited and their errors raised"""
+    failed = Future()
+    failed.set_exception(RuntimeError("boom"))
+    pinecone_store.index.upsert.return_value = failed
+
+    with pytest.raises(RuntimeError):
+        pinecone_store.add_texts(["a"], namespace="ns")
+
+
+def test_search_batch_embeds_once_and_queries_concurrently(pinecone_store):
+    """Test that search_batch makes one embedding call and one async query per query"""
+    responses = [
+        Mock(matches=[Mock(id="a", score=0.9, metadata={"text": "alpha", "source": "s"})]),
+        Mock(matches=[]),
+    ]
+    pinecone_store.index.query.side_effect = [Mock(get=Mock(return_value=r)) for r in responses]
+
+    results = pinecone_store.search_batch(["q1", "q22"], n_results=3, namespace="ns")
+
+    pinecone_store.embedding_service.embed_texts.assert_called_once_with(["q1", "q22"])
+    assert all(call.kwargs["async_req"] for call in pinecone_store.index.query.call_args_list)
+    assert results[1] == []
+    assert results[0][0]["text"] == "alpha"
+    assert results[0][0]["metadata"] == {"source": "s"}
+    assert results[0][0]["distance"] == pytest.approx(0.1)
+
+
+def test_search_without_text_skips_metadata(pinecone_store):
+    """Test that ID-only searches don't fetch metadata and field allow-lists are applied"""
+    pinecone_store.index.query.return_value = Mock(
+        matches=[Mock(id="a", score=0.8, metadata={"text": "alpha", "source": "s", "document_id": "d"})]
+    )
+
+    pinecone_store.search("q", namespace="ns", include_text=False)
+    assert pinecone_store.index.query.call_args.kwargs["include_metadata"] is False
+    assert pinecone_store.index.query.call_args.kwargs["include_values"] is False
+
+    results = pinecone_store.search("q", namespace="ns", include_text=False, metadata_fields=["source"])
+    assert pinecone_store.index.query.call_args.kwargs["include_metadata"] is True
+    assert results[0]["text"] == ""
+    assert results[0]["metadata"] == {"source": "s"}
+
+
+def test_add_texts_with_validation_takes_ownership_of_metadata(pinecone_store):
+    """Test that validated metadata already carrying the expected IDs is updated in place, not copied"""
+    tenant_id, clone_id = str(uuid4()), str(uuid4())
+    metadata = {"tenant_id": tenant_id, "clone_id": clone_id}
+
+    pinecone_store.add_texts(
+        ["hello"],
+        metadatas=[metadata],
+        namespace="ns",
+        validate_tenant_clone_ids=True,
+        expected_tenant_id=tenant_id,
+        expected_clone_id=clone_id,
+    )
+
+    assert pinecone_store.index.upsert.call_args.kwargs["vectors"][0]["metadata"] is metadata
+    assert metadata["text"] == "hello"
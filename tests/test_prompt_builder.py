@@ -0,0 +1,96 @@
+"""Tests for PromptBuilder"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.llm.client import LLMClient
+from src.llm.prompt_builder import PromptBuilder
+from src.llm.response_cache import ResponseCache
+from src.rag.retriever import RAGRetriever
+from src.personality.profile import PersonalityProfile
+
+
+@pytest.fixture
+def mock_llm_client():
+    """Create a mock LLM client"""
+    client = Mock(spec=LLMClient)
+    client.model = "gpt-4"
+    return client
+
+
+@pytest.fixture
+def mock_rag_retriever():
+    """Create a mock RAG retriever"""
+    return Mock(spec=RAGRetriever)
+
+
+@pytest.fixture
+def prompt_builder(mock_llm_client, mock_rag_retriever):
+    """Create a PromptBuilder with mocked dependencies"""
+    return PromptBuilder(
+        llm_client=mock_llm_client,
+        rag_retriever=mock_rag_retriever,
+        response_cache=ResponseCache(redis_url=None),
+    )
+
+
+@pytest.fixture
+def retrieved_chunks(mock_llm_client, mock_rag_retriever):
+    """Return three retrieved chunks costing 40 tokens each (separators are free)"""
+    chunks = [{"text": f"Chunk {i}", "metadata": {"source": "doc"}} for i in range(3)]
+    mock_rag_retriever.retrieve.return_value = chunks
+    mock_rag_retriever.format_chunk.side_effect = RAGRetriever.format_chunk
+    mock_llm_client.count_messages_tokens.return_value = 20
+    mock_llm_client.count_tokens_batch.side_effect = lambda texts: [
+        0 if text.startswith("\n") else 40 for text in texts
+    ]
+    return chunks
+
+
+def test_build_messages_packs_chunks_into_token_budget(prompt_builder, retrieved_chunks):
+    """Test that whole chunks are packed in rank order until the budget is spent"""
+    messages = prompt_builder.build_messages(
+        "What do you know?",
+        profile=PersonalityProfile(person_name="Jane Doe"),
+        max_context_tokens=120,
+    )
+
+    system_content = messages[0]["content"]
+    assert "Chunk 0" in system_content
+    assert "Chunk 1" in system_content
+    assert "Chunk 2" not in system_content
+    assert "Answer as Jane Doe, speaking in first person" in system_content
+    assert messages[-1] == {"role": "user", "content": "What do you know?"}
+    assert [c["token_count"] for c in retrieved_chunks] == [40, 40, 40]
+
+
+def test_build_messages_keeps_all_chunks_within_limit(prompt_builder, retrieved_chunks):
+    """Test that every chunk is used when they all fit"""
+    messages = prompt_builder.build_messages("Hi", max_context_tokens=1000)
+
+    assert all(f"Chunk {i}" in messages[0]["content"] for i in range(3))
+
+
+def test_generate_response_served_from_cache(prompt_builder, mock_llm_client, mock_rag_retriever):
+    """Test that a repeated low-temperature query reuses the cached response"""
+    mock_rag_retriever.retrieve.return_value = []
+    mock_llm_client.count_messages_tokens.return_value = 50
+    mock_llm_client.generate.return_value.choices = [Mock(message=Mock(content="Answer"))]
+
+    first = prompt_builder.generate_response("Question?", temperature=0.0)
+    second = prompt_builder.generate_response("Question?", temperature=0.0)
+
+    assert first == second == "Answer"
+    assert mock_llm_client.generate.call_count == 1
+
+
+def test_generate_response_not_cached_at_high_temperature(prompt_builder, mock_llm_client, mock_rag_retriever):
+    """Test that sampled (high-temperature) responses always call the LLM"""
+    mock_rag_retriever.retrieve.return_value = []
+    mock_llm_client.count_messages_tokens.return_value = 50
+    mock_llm_client.generate.return_value.choices = [Mock(message=Mock(content="Answer"))]
+
+    prompt_builder.generate_response("Question?", temperature=0.7)
+    prompt_builder.generate_response("Question?", temperature=0.7)
+
+    assert mock_llm_client.generate.call_count == 2
@@ -360,6 +360,20 @@ class TestPromptServiceEdgeCases:
         assert unicode_message in messages[1]["content"]
         assert unicode_context in messages[0]["content"]
 
+    def test_build_messages_template_placeholders_in_content(self, prompt_service):
+        """Test that $-placeholders and braces in inputs are inserted literally"""
+        rag_context = "Price is $amount, see ${clone_name} and {braces}"
+
+        messages = prompt_service.build_messages(
+            current_message="Hello",
+            rag_context=rag_context,
+            clone_name="Jane $name",
+        )
+
+        system_content = messages[0]["content"]
+        assert rag_context in system_content
+        assert "Answer as Jane $name, speaking in first person" in system_content
+
 
 class TestPromptServiceMessageStructure:
     """Test PromptService message structure and format"""
@@ -0,0 +1,122 @@
+"""Tests for RAGRetriever"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from src.rag.retriever import RAGRetriever, _search_cache, invalidate_search_cache
+from src.rag.utils import hash_chunk_content
+
+
+@pytest.fixture
+def vector_store():
+    """Create a mocked clone-scoped vector store"""
+    store = Mock()
+    store.namespace = "tenant_clone"
+    store.search.side_effect = lambda query, n_results, filter_metadata: [
+        {"text": f"{query} {i}", "metadata": {"source": "test"}, "id": str(i), "distance": 0.1 * i}
+        for i in range(n_results)
+    ]
+    return store
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Isolate tests from each other's cached search results"""
+    _search_cache._entries.clear()
+    yield
+    _search_cache._entries.clear()
+
+
+def test_retrieve_reuses_cached_search_results(vector_store):
+    """Test that a repeated query is served without searching the vector store again"""
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=3)
+
+    first = retriever.retrieve("hello")
+    first[0]["text"] = "mutated by caller"
+    second = retriever.retrieve("hello")
+
+    assert vector_store.search.call_count == 1
+    assert second[0]["text"] == "hello 0"
+
+    retriever.retrieve("hello", top_k=2)
+    assert vector_store.search.call_count == 2
+
+
+def test_invalidate_search_cache_forces_fresh_search(vector_store):
+    """Test that invalidating a namespace drops its cached results"""
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=3)
+
+    retriever.retrieve("hello")
+    invalidate_search_cache("tenant_clone")
+    retriever.retrieve("hello")
+
+    assert vector_store.search.call_count == 2
+
+
+def test_retrieve_filters_by_min_score(vector_store):
+    """Test that results beyond the distance threshold are dropped, and unscored ones kept"""
+    vector_store.search.side_effect = lambda query, n_results, filter_metadata: [
+        {"text": "close", "metadata": {}, "distance": 0.2},
+        {"text": "far", "metadata": {}, "distance": 0.6},
+        {"text": "unscored", "metadata": {}, "distance": None},
+    ]
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=3, min_score=0.5)
+
+    assert [r["text"] for r in retriever.retrieve("hello")] == ["close", "unscored"]
+
+
+def test_retrieve_many_batches_uncached_queries(vector_store):
+    """Test that retrieve_many searches only uncached queries, in one batch, in order"""
+    vector_store.search_batch.side_effect = lambda queries, n_results, filter_metadata: [
+        [{"text": query, "metadata": {}, "distance": 0.1}] for query in queries
+    ]
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=1)
+    retriever.retrieve("cached")
+
+    results = retriever.retrieve_many(["first", "cached", "second"])
+
+    assert [[r["text"] for r in query_results] for query_results in results] == [["first"], ["cached 0"], ["second"]]
+    vector_store.search_batch.assert_called_once_with(["first", "second"], n_results=1, filter_metadata=None)
+
+
+def test_retrieve_cache_ignores_case_whitespace_and_trailing_punctuation(vector_store):
+    """Test that trivially different phrasings of a query share cached results"""
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=2)
+
+    retriever.retrieve("What is the plan?")
+    retriever.retrieve("  what is   the PLAN")
+
+    assert vector_store.search.call_count == 1
+
+
+def test_retrieve_reranks_by_learned_scores(vector_store):
+    """Test that learned chunk scores re-rank results before the top_k cut"""
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=2)
+    retriever.set_chunk_scores({hash_chunk_content("hello 2"): 1.0})
+
+    results = retriever.retrieve("hello")
+
+    assert [r["text"] for r in results] == ["hello 2", "hello 0"]
+
+
+def test_score_boosts_use_stored_chunk_hash(vector_store):
+    """Test that a chunk hash stored in metadata is used instead of re-hashing the text"""
+    vector_store.search.side_effect = lambda query, n_results, filter_metadata: [
+        {"text": "far", "metadata": {"chunk_hash": "stored"}, "distance": 0.3},
+        {"text": "near", "metadata": {}, "distance": 0.1},
+    ]
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=1)
+    retriever.set_chunk_scores({"stored": 1.0})
+
+    assert [r["text"] for r in retriever.retrieve("hello")] == ["far"]
+
+
+def test_aretrieve_matches_retrieve(vector_store):
+    """Test that the async wrapper returns the same results as retrieve"""
+    retriever = RAGRetriever(clone_vector_store=vector_store, top_k=2)
+
+    results = asyncio.run(retriever.aretrieve("hello"))
+
+    assert results == retriever.retrieve("hello")
+
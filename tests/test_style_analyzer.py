@@ -0,0 +1,43 @@
+"""Tests for StyleAnalyzer"""
+
+import pytest
+
+from src.personality.style_analyzer import StyleAnalyzer
+
+
+@pytest.fixture
+def style_analyzer():
+    """Create a StyleAnalyzer instance"""
+    return StyleAnalyzer()
+
+
+def test_keywords_match_whole_words_only(style_analyzer):
+    """Test that keywords inside longer words (e.g. 'hi' in 'this') are not counted"""
+    profile = style_analyzer.analyze_texts(["This feeling is within the weather report."])
+
+    assert all(score == 0 for score in profile.tone_characteristics.values())
+    assert profile.communication_style.decision_making_style == "analytical"
+
+
+def test_phrase_keywords_are_counted(style_analyzer):
+    """Test that multi-word and hyphenated keywords are still matched"""
+    profile = style_analyzer.analyze_texts(["Thank you for the in-depth and thorough review."])
+
+    assert profile.tone_characteristics["professional"] == 1.0
+    assert profile.communication_style.detail_level == "high"
+
+
+def test_large_corpus_is_sampled(style_analyzer, monkeypatch):
+    """Test that corpora over the character budget are sampled but still fully counted"""
+    import src.personality.style_analyzer as style_analyzer_module
+
+    monkeypatch.setattr(style_analyzer_module, "MAX_ANALYSIS_CHARS", 100)
+    texts = [f"Message number {i} is great." for i in range(100)]
+
+    sampled = style_analyzer_module._sample_texts(texts, max_chars=100)
+    profile = style_analyzer.analyze_texts(texts)
+
+    assert 0 < len(sampled) < len(texts)
+    assert sum(map(len, sampled)) <= 150
+    assert profile.data_sources_count == 100
+    assert profile.tone_characteristics["positive"] == 1.0